@@ -4,51 +4,210 @@ Batch processing script for multiple ski resorts.
 """
 
 import argparse
+import gc
+import hashlib
 import json
+import multiprocessing
 import os
+import pickle
 import sys
+import time
 import yaml
-from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.processor import ResortProcessor
-from src.constants import CONFIG_FILE, OUTPUT_DIR
+from src.config_cache import load_config_cached
+from src.output import OUTPUT_FORMATS, DEFAULT_OUTPUT_FORMAT, output_hash_path, output_path, save_resort_output
+from src.constants import CONFIG_FILE, OUTPUT_DIR, TIMESTAMP_FORMAT
 
+# Largest worker count for which threads are the default executor
+THREAD_EXECUTOR_MAX_WORKERS = 10
 
-def process_single_resort(resort_name: str, config_file: str, output_dir: str) -> Tuple[str, bool, str]:
+# --executor auto: CPU/wall ratio of the probe run below which work counts as I/O-bound
+IO_BOUND_CPU_RATIO = 0.4
+
+# How often completed parallel results are flushed to stdout
+REPORT_INTERVAL_SECONDS = 0.2
+
+# Modules imported once in the forkserver and inherited by every pool worker
+FORKSERVER_PRELOAD = ['__main__', 'geopandas', 'shapely', 'pyproj', 'yaml', 'src.processor']
+
+
+# Parsed configuration, set by main or once per worker process by _worker_init
+_CONFIG: Optional[Dict[str, Any]] = None
+
+
+def _share_config(config: Dict[str, Any]) -> Tuple[SharedMemory, int]:
+    """Pickle the parsed configuration into a shared memory block for pool workers."""
+    payload = pickle.dumps(config, protocol=5)
+    shm = SharedMemory(create=True, size=max(len(payload), 1))
+    shm.buf[:len(payload)] = payload
+    return shm, len(payload)
+
+
+def _warm_imports():
+    """Import the geospatial stack and load CRS tables before the first task."""
+    import geopandas  # noqa: F401
+    import shapely.geometry  # noqa: F401
+    import pyproj
+    
+    pyproj.datadir.get_data_dir()
+    # Area calculations reproject EPSG:4326 -> EPSG:3857; build that once up front
+    pyproj.Transformer.from_crs('EPSG:4326', 'EPSG:3857', always_xy=True)
+
+
+def _process_pool_context() -> Optional[multiprocessing.context.BaseContext]:
+    """Use forkserver where available so heavy imports are paid once, not per worker."""
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return ctx
+
+
+def _worker_init(shm_name: str, size: int):
+    """Warm the worker and load the shared configuration so tasks only carry a resort name."""
+    global _CONFIG
+    _warm_imports()
+    shm = SharedMemory(name=shm_name)
+    try:
+        _CONFIG = pickle.loads(bytes(shm.buf[:size]))
+    finally:
+        shm.close()
+
+
+def _probe_executor_type(resort_name: str, output_dir: str, output_format: str,
+                         force: bool, timestamp: Optional[str] = None,
+                         workers: Optional[int] = None) -> Tuple[str, Tuple]:
     """
-    Process a single resort and return status.
+    Process one resort in-process and pick an executor from its CPU/wall time ratio.
     
     Returns:
-        Tuple of (resort_name, success, message)
+        Tuple of (executor type, process_single_resort result for the probed resort)
+    """
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    result = process_single_resort(resort_name, output_dir, output_format, force, timestamp, workers)
+    wall = time.monotonic() - wall_start
+    cpu = time.process_time() - cpu_start
+    
+    ratio = cpu / wall if wall > 0 else 1.0
+    executor_type = 'thread' if ratio < IO_BOUND_CPU_RATIO else 'process'
+    print(f"Probed {resort_name}: CPU/wall {ratio:.2f} -> {executor_type} executor")
+    return executor_type, result
+
+
+def _estimate_resort_size(resort_config: Dict[str, Any]) -> int:
+    """Cheap workload proxy: total bytes of the resort's input GeoJSON files."""
+    total = 0
+    for path in resort_config.get('data_files', {}).values():
+        try:
+            total += os.path.getsize(path)
+        except (OSError, TypeError):
+            pass
+    return total
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> bytes:
+    """Hash the processing code (src/, constants included) and the numeric library versions.
+    
+    Part of every input digest, so upgrading the code or its RNG and geometry
+    libraries reprocesses resorts instead of reporting stale outputs as cached.
+    """
+    import numpy
+    import shapely
+    
+    digest = hashlib.blake2b()
+    src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+    for name in sorted(os.listdir(src_dir)):
+        if name.endswith('.py'):
+            digest.update(name.encode('utf-8'))
+            with open(os.path.join(src_dir, name), 'rb') as f:
+                digest.update(f.read())
+    digest.update(f"numpy {numpy.__version__}\0shapely {shapely.__version__}\0"
+                  f"geos {shapely.geos_version_string}".encode('utf-8'))
+    return digest.digest()
+
+
+def _input_digest(resort_name: str, output_format: str) -> str:
+    """Hash everything that determines a resort's output: code, config section, format and input files."""
+    digest = hashlib.blake2b()
+    digest.update(_code_fingerprint())
+    resort_config = _CONFIG[resort_name]
+    digest.update(json.dumps(resort_config, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(output_format.encode('utf-8'))
+    for key in sorted(resort_config.get('data_files', {})):
+        path = resort_config['data_files'][key]
+        digest.update(key.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+        except (OSError, TypeError):
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+def process_single_resort(resort_name: str, output_dir: str,
+                          output_format: str = DEFAULT_OUTPUT_FORMAT,
+                          force: bool = False,
+                          timestamp: Optional[str] = None,
+                          workers: Optional[int] = None) -> Tuple[str, bool, str, Optional[Dict[str, Any]]]:
+    """
+    Process a single resort, write its output, and return status.
+    
+    Uses the configuration in _CONFIG (set by _worker_init or main). The
+    FeatureCollection is written here and never returned, so only the small
+    metadata dict crosses the process boundary.
+    
+    Unless force is set, a resort whose output exists and whose inputs and
+    processing code hash to the digest stored next to it (<output>.hash) is
+    skipped and reported as cached.
+    
+    timestamp, when given, is written to the output metadata so every resort
+    in a batch run carries the same run time. workers is the resort's
+    ResortProcessor worker count for parallel tree generation.
+    
+    Returns:
+        Tuple of (resort_name, success, message, metadata); metadata is None
+        for cached or failed resorts
     """
     try:
-        processor = ResortProcessor(resort_name, config_file)
-        output_geojson = processor.create_output_geojson()
+        output_file = output_path(output_dir, resort_name, output_format)
+        hash_file = output_hash_path(output_file)
+        
+        if not force and output_file.exists():
+            try:
+                if hash_file.read_text().strip() == _input_digest(resort_name, output_format):
+                    return (resort_name, True, "✓ cached (inputs unchanged)", None)
+            except OSError:
+                pass
         
-        # Create output directory
-        resort_output_dir = Path(output_dir) / resort_name
-        resort_output_dir.mkdir(parents=True, exist_ok=True)
+        processor = ResortProcessor(resort_name, config_dict=_CONFIG, workers=workers)
+        _, metadata = save_resort_output(processor, output_dir, output_format, timestamp)
+        del processor
+        gc.collect()
         
-        # Save GeoJSON output
-        output_file = resort_output_dir / f"{resort_name}_processed.geojson"
-        with open(output_file, 'w') as f:
-            json.dump(output_geojson, f, indent=2)
+        # Digest after processing so an OSM file fetched during this run is included
+        hash_file.write_text(_input_digest(resort_name, output_format))
         
-        metadata = output_geojson['metadata']
         message = f"✓ {metadata['total_features']} features ({metadata['tree_points_total']} trees)"
-        return (resort_name, True, message)
+        return (resort_name, True, message, metadata)
         
     except Exception as e:
-        return (resort_name, False, f"✗ Error: {str(e)}")
+        return (resort_name, False, f"✗ Error: {str(e)}", None)
 
 
 def main():
     """Main batch processing function."""
+    global _CONFIG
     parser = argparse.ArgumentParser(
         description="Batch process multiple ski resort GeoJSON files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -57,6 +216,8 @@ Examples:
   python scripts/batch_process.py --all
   python scripts/batch_process.py --resorts stratton mammoth
   python scripts/batch_process.py --all --parallel --max-workers 3
+  python scripts/batch_process.py --all --parallel --executor process
+  python scripts/batch_process.py --all --force   # ignore cached outputs
         """
     )
     
@@ -84,6 +245,20 @@ Examples:
         help=f'Configuration file path (default: {CONFIG_FILE})'
     )
     
+    parser.add_argument(
+        '--format',
+        choices=list(OUTPUT_FORMATS),
+        default=DEFAULT_OUTPUT_FORMAT,
+        help=f'Output format; geojsonseq writes one feature per line, geobuf writes compact '
+             f'protobuf and needs the geobuf package (default: {DEFAULT_OUTPUT_FORMAT})'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess resorts even if their inputs are unchanged since the last run'
+    )
+    
     parser.add_argument(
         '--parallel',
         action='store_true',
@@ -97,12 +272,27 @@ Examples:
         help='Maximum number of parallel workers (default: 4)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Processes each resort uses to generate trees for many forests '
+             '(default: CPU count, or 1 with --parallel so resorts do not '
+             'each start a pool of their own)'
+    )
+    
+    parser.add_argument(
+        '--executor',
+        choices=['process', 'thread', 'auto'],
+        help=f'Parallel executor type; auto probes one resort and picks threads for '
+             f'I/O-bound work (default: thread when --max-workers <= '
+             f'{THREAD_EXECUTOR_MAX_WORKERS}, otherwise process)'
+    )
+    
     args = parser.parse_args()
     
     # Load configuration to get resort list
     try:
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(args.config)
     except FileNotFoundError:
         print(f"Error: Configuration file {args.config} not found")
         sys.exit(1)
@@ -124,43 +314,110 @@ Examples:
     
     print(f"Processing {len(resorts_to_process)} resort(s)...\n")
     
+    # Threads and the sequential path reuse the config parsed above
+    _CONFIG = config
+    
+    # One run timestamp shared by every resort's output metadata
+    run_timestamp = time.strftime(TIMESTAMP_FORMAT)
+    
+    # Parallel resorts already use the CPUs; each one generating trees on a
+    # CPU-count pool as well would oversubscribe them max_workers times over
+    resort_workers = args.workers
+    if resort_workers is None and args.parallel:
+        resort_workers = 1
+    
     # Process resorts
     results = []
     
+    executor_type = 'sequential'
     if args.parallel:
-        # Parallel processing
-        with ProcessPoolExecutor(max_workers=args.max_workers) as executor:
-            futures = {
-                executor.submit(process_single_resort, resort, args.config, args.output): resort
-                for resort in resorts_to_process
-            }
-            
-            for future in as_completed(futures):
-                resort_name, success, message = future.result()
-                results.append((resort_name, success, message))
-                print(f"{resort_name:20} {message}")
+        # Longest-first scheduling: start the biggest resorts before the small ones
+        scheduled = sorted(
+            resorts_to_process,
+            key=lambda resort: _estimate_resort_size(config[resort]),
+            reverse=True
+        )
+        
+        executor_type = args.executor
+        if executor_type == 'auto' and scheduled:
+            # Probe with the smallest resort; its result counts as processed
+            executor_type, probe_result = _probe_executor_type(
+                scheduled.pop(), args.output, args.format, args.force, run_timestamp, resort_workers
+            )
+            resort_name, success, message, metadata = probe_result
+            results.append((resort_name, success, message, metadata))
+            print(f"{resort_name:20} {message}")
+        if executor_type in (None, 'auto'):
+            executor_type = 'thread' if args.max_workers <= THREAD_EXECUTOR_MAX_WORKERS else 'process'
+        
+        shared_config = None
+        if executor_type == 'thread':
+            # Threads share the config parsed above and skip pickling results back
+            executor = ThreadPoolExecutor(max_workers=args.max_workers)
+        else:
+            # One pool for the whole run; workers read the parsed config from
+            # shared memory instead of re-reading the YAML themselves
+            shared_config, size = _share_config(config)
+            executor = ProcessPoolExecutor(
+                max_workers=args.max_workers,
+                mp_context=_process_pool_context(),
+                initializer=_worker_init,
+                initargs=(shared_config.name, size)
+            )
+        
+        try:
+            with executor:
+                pending = {
+                    executor.submit(process_single_resort, resort, args.output, args.format,
+                                    args.force, run_timestamp, resort_workers)
+                    for resort in scheduled
+                }
+                
+                # Report whatever finished in each interval with a single write
+                while pending:
+                    done, pending = wait(pending, timeout=REPORT_INTERVAL_SECONDS)
+                    lines = []
+                    for future in done:
+                        resort_name, success, message, metadata = future.result()
+                        results.append((resort_name, success, message, metadata))
+                        lines.append(f"{resort_name:20} {message}")
+                    if lines:
+                        print("\n".join(lines), flush=True)
+        finally:
+            if shared_config is not None:
+                shared_config.close()
+                shared_config.unlink()
     else:
         # Sequential processing
         for resort in resorts_to_process:
             print(f"Processing {resort}...", end=" ")
-            resort_name, success, message = process_single_resort(resort, args.config, args.output)
-            results.append((resort_name, success, message))
+            resort_name, success, message, metadata = process_single_resort(
+                resort, args.output, args.format, args.force, run_timestamp, resort_workers
+            )
+            results.append((resort_name, success, message, metadata))
             print(message)
     
     # Print summary
-    successful = sum(1 for _, success, _ in results if success)
+    successful = sum(1 for _, success, _, _ in results if success)
     failed = len(results) - successful
     
+    # Cached and failed resorts carry no metadata; only freshly written outputs count
+    written = [metadata for _, _, _, metadata in results if metadata is not None]
+    
     print(f"\n{'='*50}")
     print(f"Batch Processing Complete")
     print(f"{'='*50}")
     print(f"Total resorts: {len(results)}")
+    print(f"Executor: {executor_type}")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
+    print(f"Written: {len(written)} resort(s), "
+          f"{sum(metadata['total_features'] for metadata in written):,} features "
+          f"({sum(metadata['tree_points_total'] for metadata in written):,} trees)")
     
     if failed > 0:
         print(f"\nFailed resorts:")
-        for resort_name, success, message in results:
+        for resort_name, success, message, _ in results:
             if not success:
                 print(f"  - {resort_name}: {message}")
         sys.exit(1)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Build the generated constants files from src/constants.py:
+- scripts/constants.cached.json, served by export_constants.py
+- web/public/constants.generated.js, loaded directly by the web UI
+Run at image build time (and after editing src/constants.py).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from export_constants import CACHE_FILE, load_export_json
+
+JS_FILE = Path(__file__).resolve().parent.parent / 'web' / 'public' / 'constants.generated.js'
+
+
+def _frozen_js(value, indent: int = 0) -> str:
+    """Render a JSON-compatible value as a deeply frozen JS literal."""
+    if not isinstance(value, dict):
+        return json.dumps(value)
+    pad = '  ' * (indent + 1)
+    items = ',\n'.join(f"{pad}{json.dumps(k)}: {_frozen_js(v, indent + 1)}" for k, v in value.items())
+    return f"Object.freeze({{\n{items}\n{'  ' * indent}}})"
+
+
+def _write_atomic(path: Path, content: str):
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+def main():
+    try:
+        export_json = load_export_json()
+        data = json.loads(export_json)
+        _write_atomic(CACHE_FILE, export_json)
+        _write_atomic(JS_FILE, (
+            "// Generated by scripts/build_constants_cache.py from src/constants.py - do not edit\n"
+            f"const GEOWELD_CONSTANTS = {_frozen_js(data)};\n"
+        ))
+    except Exception as e:
+        print(f"Error building constants cache: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {CACHE_FILE}")
+    print(f"Wrote {JS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
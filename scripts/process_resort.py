@@ -4,17 +4,17 @@ Main script for processing ski resort GeoJSON data.
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
 import yaml
-from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.processor import ResortProcessor, setup_logging
+from src.config_cache import load_config_cached
+from src.output import OUTPUT_FORMATS, DEFAULT_OUTPUT_FORMAT, save_resort_output
 from src.constants import CONFIG_FILE, OUTPUT_DIR
 
 
@@ -49,6 +49,14 @@ Examples:
         help=f'Configuration file path (default: {CONFIG_FILE})'
     )
     
+    parser.add_argument(
+        '--format',
+        choices=list(OUTPUT_FORMATS),
+        default=DEFAULT_OUTPUT_FORMAT,
+        help=f'Output format; geojsonseq writes one feature per line, geobuf writes compact '
+             f'protobuf and needs the geobuf package (default: {DEFAULT_OUTPUT_FORMAT})'
+    )
+    
     parser.add_argument(
         '--tree-density',
         type=int,
@@ -61,6 +69,13 @@ Examples:
         help='Override maximum trees per polygon'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Processes used to generate trees for resorts with many forests '
+             '(default: CPU count; 1 disables parallelism)'
+    )
+    
     parser.add_argument(
         '--validate-only',
         action='store_true',
@@ -85,8 +100,7 @@ Examples:
     
     # Load configuration to get list of resorts
     try:
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(args.config)
     except FileNotFoundError:
         print(f"Error: Configuration file {args.config} not found")
         sys.exit(1)
@@ -116,7 +130,7 @@ Examples:
             print(f"\nProcessing {resort_name.title()} Mountain Resort...")
             
             # Initialize processor
-            processor = ResortProcessor(resort_name, args.config)
+            processor = ResortProcessor(resort_name, config_dict=config, workers=args.workers)
             
             # Apply command line overrides
             if args.tree_density:
@@ -129,41 +143,34 @@ Examples:
                 print("  Validating input files...")
                 boundaries_gdf, features_gdf = processor.load_data()
                 print(f"  ✓ Boundary file: {len(boundaries_gdf)} features")
-                print(f"  ✓ OSM features file: {len(features_gdf)} features")
+                print(f"  ✓ OSM features file: {len(features_gdf)} forest, rock and tree features")
                 print(f"  ✓ Ski area boundary extracted successfully")
                 successful.append(resort_name)
                 continue
             
             # Process the resort
             print("  Processing features...")
-            output_geojson = processor.create_output_geojson()
-            
-            # Create output directory
-            output_dir = Path(args.output)
-            resort_output_dir = output_dir / resort_name
-            resort_output_dir.mkdir(parents=True, exist_ok=True)
+            output_file, metadata = save_resort_output(processor, args.output, args.format)
             
-            # Save GeoJSON output
-            output_file = resort_output_dir / f"{resort_name}_processed.geojson"
-            with open(output_file, 'w') as f:
-                json.dump(output_geojson, f, indent=2)
-            
-            # Print summary
-            metadata = output_geojson['metadata']
-            print(f"  ✓ Successfully created {output_file}")
-            print(f"  Feature Summary:")
-            print(f"    Total features: {metadata['total_features']:,}")
-            print(f"    - Boundary features: {metadata['boundary_features']}")
-            print(f"    - Forest areas: {metadata['forest_features']}")
+            # Print summary in a single write
+            templates = [
+                "    Total features: {total_features:,}",
+                "    - Boundary features: {boundary_features}",
+                "    - Forest areas: {forest_features}",
+            ]
             # Handle both old and new metadata formats for backward compatibility
             if 'tree_points_total' in metadata:
-                print(f"    - Individual trees: {metadata['tree_points_total']:,}")
+                templates.append("    - Individual trees: {tree_points_total:,}")
                 if metadata.get('tree_points_osm', 0) > 0:
-                    print(f"      • OSM trees: {metadata['tree_points_osm']:,}")
-                print(f"      • Generated trees: {metadata['tree_points_generated']:,}")
+                    templates.append("      • OSM trees: {tree_points_osm:,}")
+                templates.append("      • Generated trees: {tree_points_generated:,}")
             elif 'tree_points' in metadata:
-                print(f"    - Individual trees: {metadata['tree_points']:,}")
-            print(f"    - Rock features: {metadata['rock_features']}")
+                templates.append("    - Individual trees: {tree_points:,}")
+            templates.append("    - Rock features: {rock_features}")
+            
+            lines = [f"  ✓ Successfully created {output_file}", "  Feature Summary:"]
+            lines.extend(template.format_map(metadata) for template in templates)
+            sys.stdout.write("\n".join(lines) + "\n")
             
             successful.append(resort_name)
             
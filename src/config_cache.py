@@ -0,0 +1,106 @@
+"""
+Cached loading of the resort YAML configuration
+"""
+
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Any
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# JSON rather than pickle: the config directory is a shared volume, and
+# loading a planted pickle would run arbitrary code in every batch worker
+CACHE_SUFFIX = '.cache.json'
+
+# LibYAML's C loader is several times faster than the pure-Python SafeLoader
+try:
+    YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without LibYAML
+    YamlLoader = yaml.SafeLoader
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _source_key(stat: os.stat_result) -> Dict[str, int]:
+    """Identify a config file revision by modification time and size."""
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def load_config_cached(config_file: str) -> Dict[str, Any]:
+    """
+    Load the YAML configuration, reusing a JSON sidecar when it is current.
+
+    The sidecar lives next to the config file (``<config>.cache.json``) and is
+    keyed on the config's mtime and size, so any edit to the YAML invalidates it.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        yaml.YAMLError: If the configuration file cannot be parsed
+    """
+    stat = os.stat(config_file)
+    key = _source_key(stat)
+    cache_file = config_file + CACHE_SUFFIX
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = _loads(f.read())
+        if cached.get('source') == key:
+            return cached['config']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    # Hand the loader the whole document at once; LibYAML parses a bytes
+    # buffer faster than it reads through a Python file object
+    with open(config_file, 'rb') as f:
+        config = yaml.load(f.read(), Loader=YamlLoader)
+
+    _write_sidecar(cache_file, {'source': key, 'config': config})
+    return config
+
+
+def _write_sidecar(cache_file: str, payload: Dict[str, Any]):
+    """Atomically write the JSON sidecar; failures only cost the cache."""
+    try:
+        data = _dumps(payload)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Config not cacheable as JSON: {e}")
+        return
+    # YAML dates, non-string keys and the like would come back changed;
+    # such configs are simply parsed from YAML every time
+    if _loads(data)['config'] != payload['config']:
+        logger.debug(f"Config does not round-trip through JSON, not caching {cache_file}")
+        return
+
+    cache_dir = os.path.dirname(os.path.abspath(cache_file))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
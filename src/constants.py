@@ -2,6 +2,8 @@
 Constants for GeoJSON processing
 """
 
+import json
+
 # Area thresholds (square meters)
 SMALL_AREA_THRESHOLD = 1      # 0.0001 hectares
 MEDIUM_AREA_THRESHOLD = 20000    # 2.5 hectares
@@ -23,10 +25,22 @@ MIN_TREES_PER_POLYGON = 1        # Minimum trees per polygon
 DEFAULT_OSM_BUFFER_DEGREES = 0.005   # ~500m buffer around boundaries for OSM data fetch
 DEFAULT_OSM_TIMEOUT = 90             # Timeout for OSM API requests in seconds
 DEFAULT_OSM_RETRY_DELAY = 5          # Delay between OSM API retries in seconds
+DEFAULT_OSM_BACKOFF_BASE = 0.5       # Base of exponential retry backoff in seconds
+DEFAULT_OSM_BACKOFF_CAP = 30         # Maximum retry backoff in seconds
 DEFAULT_OSM_MAX_RETRIES = 3          # Maximum number of OSM API retries
+DEFAULT_OSM_QUERY_WORKERS = 2        # Maximum concurrent Overpass subqueries (public endpoints allow ~2 slots per IP)
+DEFAULT_OSM_BREAKER_THRESHOLD = 5    # Consecutive failures before the Overpass circuit opens
+DEFAULT_OSM_BREAKER_RESET_SECONDS = 60  # Cooldown before a trial request is allowed again
+DEFAULT_OSM_CACHE_TTL = 86400        # Seconds a cached Overpass response stays valid
+DEFAULT_OSM_PARALLEL_CONVERT_THRESHOLD = 5000  # Overpass elements above which conversion uses a process pool
+
+# Polygon/bounding-box area ratio below which trees are sampled from a
+# triangulation instead of by rejection (thin polygons waste most candidates)
+TRIANGLE_SAMPLING_MAX_FILL = 0.3
 
 # Area conversion constants
 HECTARE_TO_SQ_METERS = 10000     # 1 hectare = 10,000 square meters
+METERS_PER_DEGREE = 111320.0     # Length of one degree of latitude (and of longitude at the equator)
 
 # Default random seed for reproducible results
 DEFAULT_RANDOM_SEED = 42
@@ -34,6 +48,8 @@ DEFAULT_RANDOM_SEED = 42
 # Memory optimization constants
 CHUNK_SIZE_FEATURES = 1000       # Process features in chunks of this size
 LARGE_DATASET_THRESHOLD = 5000   # Features threshold to enable chunked processing
+PARALLEL_FOREST_THRESHOLD = 64   # Forest polygons above which tree generation runs on a process pool
+PARALLEL_FOREST_CHUNK_SIZE = 32  # Forest polygons per parallel task (fixed, so output does not depend on worker count)
 GC_INTERVAL = 500               # Trigger garbage collection every N processed features
 
 # Timestamp format
@@ -78,4 +94,34 @@ DEFAULT_ZONE_STYLES = {
 # File paths
 CONFIG_FILE = "config/resorts.yaml"
 OUTPUT_DIR = "output"
-DATA_DIR = "data"
\ No newline at end of file
+DATA_DIR = "data"
+OSM_CACHE_DIR = ".cache/overpass"
+CLIP_CACHE_DIR = ".cache/clip"
+CLIP_CACHE_ENV = "GEOWELD_CACHE"  # Set to 1 to reuse clipped forest/rock layers across runs
+
+# Subset of constants exported to the web UI (scripts/export_constants.py)
+_EXPORT_DATA = {
+    "area_thresholds": {
+        "small_area_threshold": SMALL_AREA_THRESHOLD,
+        "medium_area_threshold": MEDIUM_AREA_THRESHOLD,
+        "large_area_threshold": LARGE_AREA_THRESHOLD,
+        "extra_large_area_threshold": EXTRA_LARGE_AREA_THRESHOLD
+    },
+    "tree_densities": {
+        "trees_per_small_hectare": DEFAULT_TREES_PER_SMALL_HECTARE,
+        "trees_per_medium_hectare": DEFAULT_TREES_PER_MEDIUM_HECTARE,
+        "trees_per_large_hectare": DEFAULT_TREES_PER_LARGE_HECTARE,
+        "trees_per_extra_large_hectare": DEFAULT_TREES_PER_EXTRA_LARGE_HECTARE
+    },
+    "limits": {
+        "max_trees_per_polygon": DEFAULT_MAX_TREES_PER_POLYGON,
+        "min_trees_per_polygon": MIN_TREES_PER_POLYGON
+    },
+    "conversion": {
+        "hectare_to_sq_meters": HECTARE_TO_SQ_METERS
+    },
+    "defaults": {
+        "random_seed": DEFAULT_RANDOM_SEED
+    }
+}
+EXPORT_JSON = json.dumps(_EXPORT_DATA)
@@ -0,0 +1,70 @@
+"""
+Batch point-in-polygon test compiled with numba
+"""
+
+from typing import Tuple
+
+import numpy as np
+from shapely.geometry import Polygon
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; callers fall back to shapely.contains_xy
+    njit = None
+
+# Below this many requested points the JIT warm-up outweighs the faster test
+NUMBA_MIN_POINTS = 200
+
+
+def polygon_rings(polygon: Polygon) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a polygon's exterior and interior rings for contains_batch.
+
+    Returns:
+        Tuple of (coords, offsets): all ring vertices as an (M, 2) float array,
+        and ring start offsets into it with a final end offset
+    """
+    rings = [np.asarray(polygon.exterior.coords, dtype=np.float64)[:, :2]]
+    rings.extend(np.asarray(interior.coords, dtype=np.float64)[:, :2] for interior in polygon.interiors)
+    offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(ring) for ring in rings])
+    return np.concatenate(rings), offsets
+
+
+def _contains_batch(coords: np.ndarray, offsets: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Even-odd ray casting of each (x, y) against every ring.
+
+    Crossing the exterior and any holes together gives the right answer for
+    polygons with interiors, since a point inside a hole crosses twice.
+    """
+    n = xs.shape[0]
+    inside = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        x = xs[i]
+        y = ys[i]
+        result = False
+        for r in range(offsets.shape[0] - 1):
+            start = offsets[r]
+            end = offsets[r + 1]
+            j = end - 1
+            for k in range(start, end):
+                xk = coords[k, 0]
+                yk = coords[k, 1]
+                xj = coords[j, 0]
+                yj = coords[j, 1]
+                if (yk > y) != (yj > y):
+                    if x < (xj - xk) * (y - yk) / (yj - yk) + xk:
+                        result = not result
+                j = k
+        inside[i] = result
+    return inside
+
+
+# Serial on purpose: calls are a few thousand points, and numba's parallel
+# threading layers abort on concurrent calls from batch threads and are not
+# fork-safe next to the chunk pools
+if njit is not None:
+    contains_batch = njit(cache=True)(_contains_batch)
+else:
+    contains_batch = None
@@ -0,0 +1,124 @@
+"""
+GeoPackage caches for GeoJSON inputs and derived layers
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+import geopandas as gpd
+import pyogrio
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = '.gpkg'
+
+# Layer written into every cache file; GDAL derives a default layer name from
+# the file name and rejects the dots and dashes ours contain
+LAYER_NAME = 'features'
+
+# Column holding the frame index in cached layers; GeoPackage keeps no index
+INDEX_COLUMN = '__index'
+
+
+def _cache_path(path: Path, mtime_ns: int) -> Path:
+    """Sidecar for one revision of a source file: <source>.<mtime_ns>.gpkg"""
+    return path.with_name(f"{path.name}.{mtime_ns}{CACHE_SUFFIX}")
+
+
+def read_geofile_cached(path: Union[str, Path], columns: Optional[List[str]] = None,
+                        where: Optional[str] = None) -> gpd.GeoDataFrame:
+    """
+    Read a GeoJSON file, reusing a GeoPackage copy of it when one is current.
+
+    GeoPackage is a binary SQLite format that GDAL reads much faster than
+    GeoJSON text. The sidecar name embeds the source's mtime, so editing or
+    re-fetching the source invalidates it; older sidecars are removed when a
+    new one is written.
+
+    Args:
+        path: GeoJSON file to read
+        columns: Attribute columns to read (absent ones are skipped); all if None
+        where: Attribute filter evaluated inside GDAL, e.g. "landuse = 'forest'"
+    """
+    path = Path(path)
+    cache_path = _cache_path(path, os.stat(path).st_mtime_ns)
+
+    if cache_path.exists():
+        try:
+            return pyogrio.read_dataframe(cache_path, columns=columns, where=where)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable geofile cache {cache_path}: {e}")
+
+    # The sidecar always holds the whole file, so the source is read in full
+    # once; filtered reads then come from the sidecar just written
+    gdf = pyogrio.read_dataframe(path)
+    cached = not gdf.empty and _write_sidecar(path, cache_path, gdf)
+    if columns is None and where is None:
+        return gdf
+    if cached:
+        return pyogrio.read_dataframe(cache_path, columns=columns, where=where)
+    # No sidecar to filter in GDAL; read just the requested rows and columns
+    del gdf
+    return pyogrio.read_dataframe(path, columns=columns, where=where)
+
+
+def _write_gpkg(cache_path: Path, gdf: gpd.GeoDataFrame) -> bool:
+    """Atomically write gdf as a GeoPackage; failures only cost the cache."""
+    try:
+        # GDAL refuses to create a GeoPackage over an existing file, so write
+        # into a private directory on the same filesystem and rename from there
+        with tempfile.TemporaryDirectory(dir=cache_path.parent, prefix='.gpkg-') as tmp_dir:
+            tmp_path = Path(tmp_dir) / cache_path.name
+            # Keep geometry types exactly as read: no Polygon -> MultiPolygon promotion
+            pyogrio.write_dataframe(gdf, tmp_path, layer=LAYER_NAME, driver='GPKG',
+                                    promote_to_multi=False, geometry_type='Unknown')
+            os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write geofile cache {cache_path}: {e}")
+        return False
+    return True
+
+
+def _write_sidecar(path: Path, cache_path: Path, gdf: gpd.GeoDataFrame) -> bool:
+    """Write the GeoPackage sidecar for path and drop stale ones; returns whether it was written."""
+    if not _write_gpkg(cache_path, gdf):
+        return False
+
+    for stale in path.parent.glob(f"{path.name}.*{CACHE_SUFFIX}"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return True
+
+
+def read_cached_layer(cache_path: Union[str, Path]) -> Optional[gpd.GeoDataFrame]:
+    """Read a layer stored by write_cached_layer, with its index restored, or None."""
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return None
+    try:
+        gdf = pyogrio.read_dataframe(cache_path)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable layer cache {cache_path}: {e}")
+        return None
+    gdf = gdf.set_index(INDEX_COLUMN)
+    gdf.index.name = None
+    return gdf
+
+
+def write_cached_layer(cache_path: Union[str, Path], gdf: gpd.GeoDataFrame):
+    """Store a derived layer, index included, for read_cached_layer."""
+    cache_path = Path(cache_path)
+    if gdf.empty:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not create layer cache directory {cache_path.parent}: {e}")
+        return
+    _write_gpkg(cache_path, gdf.rename_axis(INDEX_COLUMN).reset_index())
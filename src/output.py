@@ -0,0 +1,182 @@
+"""
+Serialization of processed GeoJSON output
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+# Output format name -> file suffix appended to "<resort>_processed"
+OUTPUT_FORMATS = {
+    'geojson': '.geojson',
+    'geojsonseq': '.geojsonl',
+    'geobuf': '.pbf',
+}
+DEFAULT_OUTPUT_FORMAT = 'geojson'
+
+# Suffix of the metadata sidecar written next to a geojsonseq output
+METADATA_SUFFIX = '.meta.json'
+
+# Suffix of the input digest batch runs store next to an output file
+HASH_SUFFIX = '.hash'
+
+# Write buffer size; features are small, so batch them into few write() calls
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy scalars/arrays for the stdlib json fallback."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_indented(obj: Dict) -> bytes:
+    """Serialize a dict to indented UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+
+def _dumps_compact(obj: Dict) -> bytes:
+    """Serialize a dict to single-line UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+@contextmanager
+def _atomic_output(output_file: Union[str, Path]) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file next to output_file and move it into place on success.
+
+    Readers never see a partially written file, and a failed run leaves any
+    previous output untouched.
+    """
+    output_file = Path(output_file)
+    fd, tmp_path = tempfile.mkstemp(dir=output_file.parent, prefix=f".{output_file.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        # mkstemp creates 0600 files; outputs are meant to be shared with the web UI
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_geojson(metadata: Dict, features: Iterable[Dict], output_file: Union[str, Path]):
+    """
+    Write a FeatureCollection with readable metadata and compact features.
+
+    Only the metadata block is indented; each feature is written minified on
+    its own line, which keeps point-heavy outputs small while the summary at
+    the top of the file stays easy to read.
+    """
+    with _atomic_output(output_file) as f:
+        f.write(b'{"type":"FeatureCollection","metadata":')
+        f.write(_dumps_indented(metadata))
+        f.write(b',"features":[')
+        separator = b'\n'
+        for feature in features:
+            f.write(separator)
+            f.write(_dumps_compact(feature))
+            separator = b',\n'
+        f.write(b'\n]}\n')
+
+
+def metadata_path(output_file: Union[str, Path]) -> Path:
+    """Return the <output>.meta.json sidecar holding a geojsonseq output's metadata."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + METADATA_SUFFIX)
+
+
+def write_geojsonseq(metadata: Dict, features: Iterable[Dict], output_file: Union[str, Path]):
+    """
+    Write newline-delimited GeoJSON (RFC 8142 style), one feature per line.
+
+    Every line is a Feature, so GDAL's GeoJSONSeq driver and other sequence
+    readers can open the file. The metadata goes to a small <output>.meta.json
+    sidecar, where tools can read the processing summary without reading
+    the features.
+    """
+    with _atomic_output(metadata_path(output_file)) as f:
+        f.write(_dumps_indented(metadata))
+        f.write(b'\n')
+    with _atomic_output(output_file) as f:
+        for feature in features:
+            f.write(_dumps_compact(feature))
+            f.write(b'\n')
+
+
+def write_geobuf(geojson: Dict, output_file: Union[str, Path]):
+    """Write a GeoJSON dict as Geobuf (protobuf); requires the optional geobuf package."""
+    try:
+        import geobuf
+    except ImportError:
+        raise ImportError("Geobuf output requires the 'geobuf' package (pip install geobuf)")
+
+    pbf = geobuf.encode(geojson)
+    with _atomic_output(output_file) as f:
+        f.write(pbf)
+
+
+def output_path(output_dir: Union[str, Path], resort_name: str,
+                output_format: str = DEFAULT_OUTPUT_FORMAT) -> Path:
+    """Return <output_dir>/<resort_name>/<resort_name>_processed<suffix> for a format."""
+    return Path(output_dir) / resort_name / f"{resort_name}_processed{OUTPUT_FORMATS[output_format]}"
+
+
+def output_hash_path(output_file: Union[str, Path]) -> Path:
+    """Return the <output>.hash file batch runs use to skip resorts with unchanged inputs."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + HASH_SUFFIX)
+
+
+def save_resort_output(processor, output_dir: Union[str, Path],
+                       output_format: str = DEFAULT_OUTPUT_FORMAT,
+                       timestamp: Optional[str] = None) -> Tuple[Path, Dict]:
+    """
+    Process a resort and write its output in the requested format.
+
+    Args:
+        processor: ResortProcessor for the resort
+        output_dir: Base output directory; files go in <output_dir>/<resort_name>/
+        output_format: One of OUTPUT_FORMATS
+        timestamp: Metadata timestamp; defaults to the current time
+
+    Returns:
+        Tuple of (output file path, metadata dict)
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}'")
+
+    output_file = output_path(output_dir, processor.resort_name, output_format)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # A stored input digest describes the output about to be replaced; drop it
+    # so a later batch run cannot skip this resort on its strength. Batch runs
+    # write a fresh one after this returns
+    output_hash_path(output_file).unlink(missing_ok=True)
+
+    if output_format == 'geojsonseq':
+        metadata, features = processor.prepare_output(timestamp)
+        write_geojsonseq(metadata, features, output_file)
+    elif output_format == 'geobuf':
+        output_geojson = processor.create_output_geojson(timestamp)
+        metadata = output_geojson['metadata']
+        write_geobuf(output_geojson, output_file)
+    else:
+        metadata, features = processor.prepare_output(timestamp)
+        write_geojson(metadata, features, output_file)
+
+    return output_file, metadata
@@ -2,36 +2,275 @@
 Overpass API integration for fetching OSM features.
 """
 
+import atexit
+import hashlib
+import itertools
 import json
 import logging
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
 import requests
-from shapely.geometry import shape
+from requests.adapters import HTTPAdapter
 from .constants import (
     DEFAULT_OSM_BUFFER_DEGREES, 
     DEFAULT_OSM_TIMEOUT, 
-    DEFAULT_OSM_RETRY_DELAY,
-    DEFAULT_OSM_MAX_RETRIES
+    DEFAULT_OSM_MAX_RETRIES,
+    DEFAULT_OSM_BACKOFF_BASE,
+    DEFAULT_OSM_BACKOFF_CAP,
+    DEFAULT_OSM_QUERY_WORKERS,
+    DEFAULT_OSM_BREAKER_THRESHOLD,
+    DEFAULT_OSM_BREAKER_RESET_SECONDS,
+    DEFAULT_OSM_CACHE_TTL,
+    DEFAULT_OSM_PARALLEL_CONVERT_THRESHOLD,
+    OSM_CACHE_DIR
 )
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is listed in requirements.txt
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; _close_ring then runs as plain NumPy
+    njit = None
+
+# Top-level members of every generated OSM FeatureCollection besides its features
+COLLECTION_INFO = {
+    'generator': 'GeoWeld Overpass Client',
+    'copyright': 'The data included in this document is from www.openstreetmap.org. The data is made available under ODbL.',
+}
+
+# Bytes pulled from the response per read while stream-parsing
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Write buffer for osm_features output; features are small, so batch them into few write() calls
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class _ResponseReader:
+    """Minimal file-like reader over a streamed response that tees every chunk to a sink."""
+    
+    def __init__(self, response: requests.Response, sink: Optional[BinaryIO] = None):
+        # iter_content decodes gzip and wraps transport errors as RequestException
+        self._chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        self._sink = sink
+        self._buffer = b''
+    
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            if self._sink is not None:
+                self._sink.write(chunk)
+            self._buffer += chunk
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact newline-terminated JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+# Overpass QL wrapper around the per-group filters; relation members are
+# fetched recursively so complete geometries can be built. Nodes pulled in by
+# the recursion are dropped before output: way and relation geometry is
+# already inlined by "out geom", and node elements are never converted
+_QUERY_TEMPLATE = """[out:json][timeout:90];
+(
+{filters}
+);
+// Recursively get all members of relations to build complete geometries
+(._; rel(r); >>;);
+// Vertices are inlined in way geometry; skip emitting them as separate elements
+(._; - node._;);
+out geom;"""
+
+
+@lru_cache(maxsize=None)
+def _tag_selectors(tags: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Way and relation selectors for a tag group, e.g. 'way["landuse"="forest"]'; only the bbox varies per query."""
+    return tuple(
+        f'{element_type}["{key}"="{value}"]'
+        for key, value in tags
+        for element_type in ('way', 'relation')
+    )
+
+
+_lon_lat = itemgetter('lon', 'lat')
+
+
+def _coords_array(nodes: List[Dict]) -> np.ndarray:
+    """Build an (N, 2) lon/lat array from Overpass geometry nodes without per-node lists."""
+    flat = itertools.chain.from_iterable(map(_lon_lat, nodes))
+    return np.fromiter(flat, dtype=np.float64, count=2 * len(nodes)).reshape(-1, 2)
+
+
+def _close_ring(arr: np.ndarray) -> np.ndarray:
+    """Return arr with its first point appended if it has more than two points and is not closed."""
+    if arr.shape[0] > 2 and (arr[0, 0] != arr[-1, 0] or arr[0, 1] != arr[-1, 1]):
+        return np.vstack((arr, arr[:1]))
+    return arr
+
+
+if njit is not None:
+    _close_ring = njit(cache=True)(_close_ring)
+
+
+def _parse_elements(stream) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Parse the 'elements' array and 'remark' of an Overpass JSON document from a binary stream.
+    
+    With ijson the document is parsed member by member, so only the elements
+    (not the raw body) are ever resident; without it the whole body is read
+    and parsed in one go (orjson, else json). Raises ValueError on malformed input.
+    
+    Returns:
+        Tuple of (elements, remark); Overpass reports runtime errors such as
+        timeouts or running out of memory as a remark next to partial elements
+    """
+    if ijson is None:
+        data = _loads(stream.read())
+        return data.get('elements', []), data.get('remark')
+    elements, remark = [], None
+    try:
+        for key, value in ijson.kvitems(stream, '', use_float=True):
+            if key == 'elements':
+                elements = value
+            elif key == 'remark':
+                remark = value
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+    return elements, remark
+
+
+class OverpassRuntimeError(requests.exceptions.RequestException):
+    """Raised when Overpass answers 200 but reports a runtime error (timeout, out of memory) in a remark."""
+    pass
+
+
+class BreakerOpenError(Exception):
+    """Raised when Overpass calls are short-circuited because the endpoint is failing."""
+    pass
+
+
+class _Breaker:
+    """Circuit breaker (closed -> open -> half-open) shared by all Overpass calls in a process."""
+    
+    def __init__(self, failure_threshold: int = DEFAULT_OSM_BREAKER_THRESHOLD,
+                 reset_timeout: float = DEFAULT_OSM_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = 'closed'
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def before_call(self):
+        """Raise BreakerOpenError unless a request may be attempted now."""
+        with self._lock:
+            if self.state == 'open':
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise BreakerOpenError(f"Overpass circuit open, retrying in {remaining:.0f}s")
+                # Cooldown elapsed: let a single trial request through
+                self.state = 'half_open'
+            elif self.state == 'half_open':
+                raise BreakerOpenError("Overpass circuit half-open, trial request in flight")
+    
+    def on_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = 'closed'
+    
+    def on_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+_breaker = _Breaker()
+
 
 class OverpassClient:
     """Client for fetching OSM data from Overpass API."""
     
+    __slots__ = ('session',)
+    
     OVERPASS_URL = "https://overpass.private.coffee/api/interpreter"
     TIMEOUT = DEFAULT_OSM_TIMEOUT
-    RETRY_DELAY = DEFAULT_OSM_RETRY_DELAY
     MAX_RETRIES = DEFAULT_OSM_MAX_RETRIES
+    BACKOFF_BASE = DEFAULT_OSM_BACKOFF_BASE
+    BACKOFF_CAP = DEFAULT_OSM_BACKOFF_CAP
+    # 4xx responses that are worth retrying (timeout, rate limit); other 4xx fail immediately
+    RETRYABLE_CLIENT_ERRORS = (408, 429)
+    QUERY_WORKERS = DEFAULT_OSM_QUERY_WORKERS
+    CACHE_DIR = Path(OSM_CACHE_DIR)
+    CACHE_TTL = DEFAULT_OSM_CACHE_TTL
+    # Element count above which conversion runs on a process pool
+    PARALLEL_CONVERT_THRESHOLD = DEFAULT_OSM_PARALLEL_CONVERT_THRESHOLD
+    CONVERT_CHUNK_SIZE = 256
+    # Keep-alive connections per host; sized above QUERY_WORKERS so parallel subqueries never wait on the pool
+    POOL_MAXSIZE = 16
+    
+    # (key, value) tag filters fetched together in one subquery; subqueries run in parallel
+    QUERY_GROUPS = (
+        # Forest features
+        (('landuse', 'forest'),),
+        (('natural', 'wood'),),
+        # Rock features
+        (('natural', 'bare_rock'), ('natural', 'cliff')),
+        (('natural', 'scree'), ('natural', 'stone')),
+        (('natural', 'rock'), ('landuse', 'quarry')),
+    )
     
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'GeoWeld/1.0 (ski resort processor)'
+            'User-Agent': 'GeoWeld/1.0 (ski resort processor)',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        
+        # Retries are handled in _post so HTTP errors get backoff too, not just connect errors
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.POOL_MAXSIZE,
+                              pool_block=False, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def close(self):
         """Close the requests session."""
@@ -56,169 +295,378 @@ class OverpassClient:
         Returns:
             GeoJSON FeatureCollection dictionary
         """
-        query = self._build_query(bounds)
+        geojson = self._convert_to_geojson_stream(self.fetch_elements(bounds))
+        logger.info(f"Successfully fetched {len(geojson['features'])} features")
+        return geojson
+    
+    def fetch_elements(self, bounds: Tuple[float, float, float, float]) -> List[Dict]:
+        """
+        Fetch the raw Overpass elements within the given bounds.
+        
+        Each QUERY_GROUPS entry is sent as its own Overpass query on a thread
+        pool, so one slow tag does not hold up the rest. Results are merged in
+        group order and deduplicated by element type and id.
+        
+        Args:
+            bounds: Bounding box (min_lon, min_lat, max_lon, max_lat)
+        
+        Returns:
+            List of Overpass element dictionaries
+        """
+        queries = [self._build_query(bounds, tags) for tags in self.QUERY_GROUPS]
+        
+        elements = {}
+        with ThreadPoolExecutor(max_workers=min(self.QUERY_WORKERS, len(queries))) as executor:
+            futures = [executor.submit(self._post, query) for query in queries]
+            # Drain in submission order so the merged element order is deterministic
+            for future in futures:
+                for element in future.result():
+                    elements.setdefault((element['type'], element['id']), element)
+        
+        return list(elements.values())
+    
+    def _cache_path(self, query: str) -> Path:
+        """Location of the cached raw response for a query."""
+        return self.CACHE_DIR / f"{hashlib.sha256(query.encode('utf-8')).hexdigest()}.json"
+    
+    def _read_cache(self, query: str) -> Optional[List[Dict]]:
+        """Return the cached Overpass elements for a query if the response is younger than CACHE_TTL."""
+        cache_path = self._cache_path(query)
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self.CACHE_TTL:
+                return None
+            # Cached bodies are local and complete, so one bulk parse beats streaming
+            data = _loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if 'remark' in data:
+            # Failed query cached before remarks were checked; never trust it
+            return None
+        elements = data.get('elements', [])
+        logger.info(f"Using cached Overpass response {cache_path.name}")
+        return elements
+    
+    @contextmanager
+    def _cache_writer(self, query: str) -> Iterator[Optional[BinaryIO]]:
+        """
+        Yield a file to tee a raw Overpass response into, or None if the cache is unwritable.
+        
+        The file is moved into place only if the block completes, so an
+        interrupted download never leaves a truncated cache entry behind.
+        """
+        cache_path = self._cache_path(query)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        except OSError as e:
+            logger.debug(f"Could not write Overpass cache {cache_path}: {e}")
+            yield None
+            return
+        
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                yield f
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _post(self, query: str) -> List[Dict]:
+        """POST a single Overpass query with retries and return its elements.
+        
+        The response body is streamed: elements are parsed incrementally while
+        the raw bytes are teed to the on-disk cache, so the full body is never
+        held in memory as one string. Re-running with the same bounds within
+        CACHE_TTL skips the request entirely. Responses whose remark reports
+        an Overpass runtime error are retried and never cached.
+        """
+        cached = self._read_cache(query)
+        if cached is not None:
+            return cached
         
         for attempt in range(self.MAX_RETRIES):
+            _breaker.before_call()
             try:
                 logger.info(f"Fetching OSM data (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                response = self.session.post(
+                with self.session.post(
                     self.OVERPASS_URL,
                     data={'data': query},
-                    timeout=self.TIMEOUT
-                )
-                response.raise_for_status()
+                    timeout=self.TIMEOUT,
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+                    
+                    with self._cache_writer(query) as sink:
+                        try:
+                            elements, remark = _parse_elements(_ResponseReader(response, sink))
+                        except ValueError as e:
+                            # Truncated or garbled body: treat like any other failed request
+                            raise requests.exceptions.InvalidJSONError(
+                                f"Invalid Overpass response: {e}", response=response)
+                        if remark:
+                            # Raising inside the writer discards the cache entry; the
+                            # elements may be truncated, so retry instead of returning them
+                            raise OverpassRuntimeError(f"Overpass runtime error: {remark}", response=response)
                 
-                data = response.json()
-                geojson = self._convert_to_geojson(data)
-                logger.info(f"Successfully fetched {len(geojson['features'])} features")
-                return geojson
+                _breaker.on_success()
+                return elements
                 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Overpass API request failed: {e}")
+                response = getattr(e, 'response', None)
+                status = response.status_code if response is not None else None
+                if status is not None and 400 <= status < 500 and status not in self.RETRYABLE_CLIENT_ERRORS:
+                    # The endpoint answered, so it is up; the request itself is bad
+                    _breaker.on_success()
+                    raise
+                if status == 429:
+                    # Rate limited: the endpoint is up, so back off without
+                    # counting it toward opening the circuit for sibling subqueries
+                    _breaker.on_success()
+                else:
+                    _breaker.on_failure()
                 if attempt < self.MAX_RETRIES - 1:
-                    logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                    delay = self._retry_delay(attempt, response)
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
                 else:
                     raise
+            except BaseException:
+                # Anything else (a parser bug, an interrupt) must still settle
+                # the breaker; a half-open trial that never reports back would
+                # block every later call for the life of the shared client
+                _breaker.on_failure()
+                raise
+    
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Exponential backoff with full jitter, honoring Retry-After on 429/503."""
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.BACKOFF_CAP)
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * (2 ** attempt)))
     
-    def _build_query(self, bounds: Tuple[float, float, float, float]) -> str:
-        """Build Overpass QL query for forest and rock features."""
+    def _build_query(self, bounds: Tuple[float, float, float, float],
+                     tags: Tuple[Tuple[str, str], ...]) -> str:
+        """Build an Overpass QL query for ways and relations matching any of the given tags."""
         min_lon, min_lat, max_lon, max_lat = bounds
+        bbox = f"({min_lat},{min_lon},{max_lat},{max_lon})"
         
-        query = f"""
-[out:json][timeout:90];
-(
-  // Forest features
-  way["landuse"="forest"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["natural"="wood"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["landuse"="forest"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="wood"]({min_lat},{min_lon},{max_lat},{max_lon});
-  
-  // Rock features
-  way["natural"="bare_rock"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["natural"="rock"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["natural"="cliff"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["natural"="scree"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["natural"="stone"]({min_lat},{min_lon},{max_lat},{max_lon});
-  way["landuse"="quarry"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="bare_rock"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="rock"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="cliff"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="scree"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["natural"="stone"]({min_lat},{min_lon},{max_lat},{max_lon});
-  relation["landuse"="quarry"]({min_lat},{min_lon},{max_lat},{max_lon});
-);
-// Recursively get all members of relations to build complete geometries
-(._; rel(r); >>;);
-out geom;
-"""
-        return query.strip()
+        filters = "\n".join(f"  {selector}{bbox};" for selector in _tag_selectors(tags))
+        return _QUERY_TEMPLATE.format(filters=filters)
     
-    def _convert_to_geojson(self, overpass_data: Dict) -> Dict:
-        """Convert Overpass JSON to GeoJSON format."""
-        features = []
-        
-        for element in overpass_data.get('elements', []):
-            # Skip elements without geometry (ways/relations need geometry/members)
-            if element['type'] == 'way' and 'geometry' not in element:
-                continue
-            elif element['type'] == 'relation' and 'members' not in element:
-                continue
-            
-            # Convert Overpass geometry to GeoJSON geometry
-            geometry = self._convert_geometry(element)
-            if not geometry:
-                continue
-            
-            # Extract properties
-            properties = {
-                '@id': f"{element['type']}/{element['id']}"
-            }
-            
-            # Add all tags as properties
-            if 'tags' in element:
-                properties.update(element['tags'])
-            
-            features.append({
-                'type': 'Feature',
-                'properties': properties,
-                'geometry': geometry
-            })
-        
+    def _convert_to_geojson_stream(self, elements: Iterable[Dict]) -> Dict:
+        """Convert an iterable of Overpass elements to a GeoJSON FeatureCollection."""
         return {
             'type': 'FeatureCollection',
-            'generator': 'GeoWeld Overpass Client',
-            'copyright': 'The data included in this document is from www.openstreetmap.org. The data is made available under ODbL.',
-            'features': features
+            **COLLECTION_INFO,
+            'features': list(self.iter_features(elements))
         }
     
-    def _convert_geometry(self, element: Dict) -> Optional[Dict]:
-        """Convert Overpass element geometry to GeoJSON geometry."""
-        if element['type'] == 'way':
-            coords = [[node['lon'], node['lat']] for node in element['geometry']]
-            
-            # Check if it's a closed way (polygon)
-            if len(coords) > 2 and coords[0] == coords[-1]:
+    def iter_features(self, elements: Iterable[Dict], workers: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Yield a GeoJSON Feature for each Overpass element that has usable geometry.
+        
+        Responses with more than PARALLEL_CONVERT_THRESHOLD elements are
+        converted on a pool of workers processes (default: CPU count) in
+        chunks; output order is preserved. Conversion stays in-process with
+        workers <= 1, inside pool workers, and off the main thread, where
+        starting another pool would oversubscribe the CPUs.
+        
+        Args:
+            elements: Overpass element dictionaries
+            workers: Conversion processes, as passed to ResortProcessor
+        """
+        if not isinstance(elements, (list, tuple)):
+            elements = list(elements)
+        
+        workers = workers or os.cpu_count()
+        if (len(elements) <= self.PARALLEL_CONVERT_THRESHOLD or workers <= 1
+                or multiprocessing.current_process().daemon
+                or threading.current_thread() is not threading.main_thread()):
+            # Local rather than per-instance, since the shared client may convert on several threads
+            ring_cache = {}
+            for element in elements:
+                feature = _element_to_feature(element, ring_cache)
+                if feature is not None:
+                    yield feature
+            return
+        
+        logger.info(f"Converting {len(elements)} elements on {workers} processes")
+        with _pool_context().Pool(workers) as pool:
+            for feature in pool.imap(_convert_element, elements, chunksize=self.CONVERT_CHUNK_SIZE):
+                if feature is not None:
+                    yield feature
+
+
+def _convert_geometry(element: Dict, ring_cache: Dict) -> Optional[Dict]:
+    """Convert Overpass element geometry to GeoJSON geometry."""
+    if element['type'] == 'way':
+        arr = _coords_array(element['geometry'])
+        coords = arr.tolist()
+
+        # Check if it's a closed way (polygon)
+        if len(arr) > 2 and np.array_equal(arr[0], arr[-1]):
+            return {
+                'type': 'Polygon',
+                'coordinates': [coords]
+            }
+        else:
+            return {
+                'type': 'LineString',
+                'coordinates': coords
+            }
+
+    elif element['type'] == 'relation':
+        # Handle multipolygon relations and area relations (forest/rock features)
+        tags = element.get('tags', {})
+        is_multipolygon = tags.get('type') == 'multipolygon'
+        is_area_relation = any(tag in tags for tag in ['landuse', 'natural', 'leisure', 'amenity'])
+
+        if is_multipolygon or is_area_relation:
+            polygons = []
+
+            for member in element.get('members', []):
+                if member['type'] == 'way' and 'geometry' in member and member['role'] == 'outer':
+                    ring = _member_ring(member, ring_cache)
+                    if ring is not None:
+                        polygons.append([ring])
+                    # Note: Inner rings would need more complex handling
+
+            if len(polygons) == 1:
                 return {
                     'type': 'Polygon',
-                    'coordinates': [coords]
+                    'coordinates': polygons[0]
                 }
-            else:
+            elif len(polygons) > 1:
                 return {
-                    'type': 'LineString',
-                    'coordinates': coords
+                    'type': 'MultiPolygon',
+                    'coordinates': polygons
                 }
-        
-        elif element['type'] == 'relation':
-            # Handle multipolygon relations and area relations (forest/rock features)
-            tags = element.get('tags', {})
-            is_multipolygon = tags.get('type') == 'multipolygon'
-            is_area_relation = any(tag in tags for tag in ['landuse', 'natural', 'leisure', 'amenity'])
-            
-            if is_multipolygon or is_area_relation:
-                polygons = []
-                
-                for member in element.get('members', []):
-                    if member['type'] == 'way' and 'geometry' in member:
-                        coords = [[node['lon'], node['lat']] for node in member['geometry']]
-                        
-                        # Skip invalid ways (need at least 3 unique points for a polygon)
-                        if len(coords) < 3:
-                            continue
-                        
-                        # Ensure ring is closed (critical for GeoPandas compatibility)
-                        if coords[0] != coords[-1]:
-                            coords.append(coords[0])
-                        
-                        # Final check: need at least 4 points for a closed polygon
-                        if len(coords) < 4:
-                            continue
-                            
-                        if member['role'] == 'outer':
-                            polygons.append([coords])
-                        # Note: Inner rings would need more complex handling
-                
-                if len(polygons) == 1:
-                    return {
-                        'type': 'Polygon',
-                        'coordinates': polygons[0]
-                    }
-                elif len(polygons) > 1:
-                    return {
-                        'type': 'MultiPolygon',
-                        'coordinates': polygons
-                    }
-        
+
+    return None
+
+
+def _member_ring(member: Dict, ring_cache: Dict) -> Optional[List[List[float]]]:
+    """
+    Return the closed coordinate ring for a relation member way, or None if it is too short.
+
+    Rings are cached by way id in ring_cache for the current conversion, since shared
+    boundaries make the same way a member of several relations. Cached
+    lists are shared between features and must not be mutated.
+    """
+    ref = member.get('ref')
+    if ref is not None and ref in ring_cache:
+        return ring_cache[ref]
+
+    ring = None
+    arr = _coords_array(member['geometry'])
+
+    # Skip invalid ways (need at least 3 unique points for a polygon)
+    if len(arr) >= 3:
+        # Ensure ring is closed (critical for GeoPandas compatibility)
+        arr = _close_ring(arr)
+
+        # Final check: need at least 4 points for a closed polygon
+        if len(arr) >= 4:
+            ring = arr.tolist()
+
+    if ref is not None:
+        ring_cache[ref] = ring
+    return ring
+
+
+def _element_to_feature(element: Dict, ring_cache: Dict) -> Optional[Dict]:
+    """Convert one Overpass element to a GeoJSON Feature, or None if it has no usable geometry."""
+    # Skip elements without geometry (ways/relations need geometry/members)
+    if element['type'] == 'way' and 'geometry' not in element:
         return None
+    elif element['type'] == 'relation' and 'members' not in element:
+        return None
+    
+    # Convert Overpass geometry to GeoJSON geometry
+    geometry = _convert_geometry(element, ring_cache)
+    if not geometry:
+        return None
+    
+    # Properties are the element id plus all of its tags, built in one go
+    return {
+        'type': 'Feature',
+        'properties': {'@id': f"{element['type']}/{element['id']}", **element.get('tags', {})},
+        'geometry': geometry
+    }
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start conversion workers with forkserver (else spawn) rather than forking this process."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+# Ring cache of a conversion pool worker; each pool lives for a single conversion
+_worker_ring_cache: Dict = {}
+
+
+def _convert_element(element: Dict) -> Optional[Dict]:
+    """Pool entry point for _element_to_feature (must be module-level to be picklable)."""
+    return _element_to_feature(element, _worker_ring_cache)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> OverpassClient:
+    """
+    Return the process-wide OverpassClient.
+    
+    Sharing one client keeps its keep-alive connection pool (and TLS
+    sessions) open across every resort fetched in a batch run. The session
+    is closed at interpreter exit.
+    """
+    client = OverpassClient()
+    atexit.register(client.close)
+    return client
+
+
+def _write_feature_collection(output_path: Path, features: Iterable[Dict]) -> int:
+    """
+    Stream a FeatureCollection to output_path one feature at a time and return the feature count.
+    
+    The file is written to a temporary sibling and moved into place at the
+    end, so a failed fetch never clobbers the previous file that
+    fetch_osm_features falls back to.
+    """
+    header = _dumps({'type': 'FeatureCollection', **COLLECTION_INFO})
+    count = 0
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            # Reopen the header object to append the features array
+            f.write(header.rstrip()[:-1])
+            f.write(b',"features":[')
+            for feature in features:
+                if count:
+                    f.write(b',')
+                f.write(b'\n')
+                f.write(_dumps(feature).rstrip())
+                count += 1
+            f.write(b'\n]}\n')
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
 
 
-def fetch_osm_features(resort_name: str, bounds: Tuple[float, float, float, float]) -> Path:
+def fetch_osm_features(resort_name: str, bounds: Tuple[float, float, float, float],
+                       workers: Optional[int] = None) -> Path:
     """
     Fetch OSM features for a resort from Overpass API.
     
     Args:
         resort_name: Name of the resort
         bounds: Bounding box (min_lon, min_lat, max_lon, max_lat)
+        workers: Processes for converting large responses (see OverpassClient.iter_features)
     
     Returns:
         Path to the OSM features GeoJSON file
@@ -239,16 +687,23 @@ def fetch_osm_features(resort_name: str, bounds: Tuple[float, float, float, floa
     )
     
     try:
-        with OverpassClient() as client:
-            geojson = client.fetch_features(buffered_bounds)
-        
-        # Save to file
-        with open(output_path, 'w') as f:
-            json.dump(geojson, f, indent=2)
+        client = get_client()
+        elements = client.fetch_elements(buffered_bounds)
+        # Features are serialized as they are converted; no FeatureCollection dict is built
+        count = _write_feature_collection(output_path, client.iter_features(elements, workers))
         
+        logger.info(f"Successfully fetched {count} features")
         logger.info(f"Saved OSM features to: {output_path}")
         return output_path
         
+    except BreakerOpenError as e:
+        # Known outage: skip straight to the fallback without reporting a new failure
+        logger.info(f"Skipping Overpass fetch: {e}")
+        if output_path.exists():
+            logger.warning("Using existing OSM features file as fallback")
+            return output_path
+        raise
+        
     except Exception as e:
         logger.error(f"Failed to fetch OSM features: {e}")
         
@@ -260,6 +715,52 @@ def fetch_osm_features(resort_name: str, bounds: Tuple[float, float, float, floa
             raise
 
 
+def _position_arrays(coords) -> Iterator[np.ndarray]:
+    """Yield (N, 2+) arrays of positions from arbitrarily nested GeoJSON coordinates."""
+    if not coords:
+        return
+    first = coords[0]
+    if isinstance(first, (int, float)):
+        # A single position (Point)
+        yield np.asarray([coords], dtype=np.float64)
+    elif first and isinstance(first[0], (int, float)):
+        # A list of positions (LineString, ring, MultiPoint)
+        yield np.asarray(coords, dtype=np.float64)
+    else:
+        for part in coords:
+            yield from _position_arrays(part)
+
+
+def _geom_bounds(geometry: Dict) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Bounding box of a raw GeoJSON geometry, computed from its coordinates with NumPy.
+    
+    No shapely geometry is built, which matters for dense boundary polygons.
+    Returns None for empty geometries.
+    """
+    if geometry.get("type") == "GeometryCollection":
+        parts = [b for b in map(_geom_bounds, geometry.get("geometries", [])) if b is not None]
+        return _merge_bounds(parts) if parts else None
+    
+    arrays = list(_position_arrays(geometry.get("coordinates")))
+    if not arrays:
+        return None
+    positions = np.concatenate([a[:, :2] for a in arrays])
+    lon_min, lat_min = positions.min(axis=0)
+    lon_max, lat_max = positions.max(axis=0)
+    return (float(lon_min), float(lat_min), float(lon_max), float(lat_max))
+
+
+def _merge_bounds(bounds_list: List[Tuple[float, float, float, float]]) -> Tuple[float, float, float, float]:
+    """Smallest bounding box covering every (min_lon, min_lat, max_lon, max_lat) in bounds_list."""
+    return (
+        min(b[0] for b in bounds_list),
+        min(b[1] for b in bounds_list),
+        max(b[2] for b in bounds_list),
+        max(b[3] for b in bounds_list),
+    )
+
+
 def get_bounds_from_boundaries(boundaries_path: Path) -> Tuple[float, float, float, float]:
     """
     Extract bounding box from boundaries GeoJSON file.
@@ -271,49 +772,40 @@ def get_bounds_from_boundaries(boundaries_path: Path) -> Tuple[float, float, flo
     Returns:
         Bounding box tuple (min_lon, min_lat, max_lon, max_lat)
     """
-    with open(boundaries_path) as f:
-        data = json.load(f)
+    with open(boundaries_path, 'rb') as f:
+        data = _loads(f.read())
     
     def _normalize(zone: str) -> str:
         """Normalize ZoneType values for comparison."""
         return zone.lower().replace(" ", "_")
 
-    # First try to find feature_boundary polygons
-    feature_geom = None
-    for feature in data["features"]:
-        zone_type = _normalize(feature.get("properties", {}).get("ZoneType", ""))
-        if zone_type == "feature_boundary":
-            geom = shape(feature["geometry"])
-            feature_geom = geom if feature_geom is None else feature_geom.union(geom)
+    def _zone_bounds(zone: str) -> List[Tuple[float, float, float, float]]:
+        """Bounds of every feature with the given (normalized) ZoneType."""
+        matches = (
+            _geom_bounds(feature["geometry"])
+            for feature in data["features"]
+            if _normalize(feature.get("properties", {}).get("ZoneType", "")) == zone
+        )
+        return [b for b in matches if b is not None]
 
-    if feature_geom is not None:
-        logger.info(f"Using feature_boundary for OSM data fetching: {feature_geom.bounds}")
-        return feature_geom.bounds
+    # Only the extent is needed, so per-feature bounds are merged rather than
+    # unioning the geometries. First try to find feature_boundary polygons
+    feature_bounds = _zone_bounds("feature_boundary")
+    if feature_bounds:
+        bounds = _merge_bounds(feature_bounds)
+        logger.info(f"Using feature_boundary for OSM data fetching: {bounds}")
+        return bounds
 
     # Fall back to ski_area_boundary if no feature_boundary was found
     logger.warning("No feature_boundary found, falling back to ski_area_boundary")
-    ski_geom = None
-    for feature in data["features"]:
-        zone_type = _normalize(feature.get("properties", {}).get("ZoneType", ""))
-        if zone_type == "ski_area_boundary":
-            geom = shape(feature["geometry"])
-            ski_geom = geom if ski_geom is None else ski_geom.union(geom)
-
-    if ski_geom is not None:
-        return ski_geom.bounds
+    ski_bounds = _zone_bounds("ski_area_boundary")
+    if ski_bounds:
+        return _merge_bounds(ski_bounds)
 
     # Fall back to union of all features as last resort
     logger.warning("No feature_boundary or ski_area_boundary found, using all features")
-    all_bounds = []
-    for feature in data["features"]:
-        geom = shape(feature["geometry"])
-        all_bounds.append(geom.bounds)
-
+    all_bounds = [b for b in (_geom_bounds(f["geometry"]) for f in data["features"]) if b is not None]
     if all_bounds:
-        min_lon = min(b[0] for b in all_bounds)
-        min_lat = min(b[1] for b in all_bounds)
-        max_lon = max(b[2] for b in all_bounds)
-        max_lat = max(b[3] for b in all_bounds)
-        return (min_lon, min_lat, max_lon, max_lat)
+        return _merge_bounds(all_bounds)
 
     raise ValueError("Could not extract bounds from boundaries file")
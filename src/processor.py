@@ -2,36 +2,61 @@
 Core GeoJSON processor for ski resort data
 """
 
+import copy
+import functools
 import gc
+import hashlib
+import itertools
+import multiprocessing
 import json
 import logging
-import random
 import os
+import threading
+import time
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple, Optional, Any, Iterator, Generator
-from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-import pandas as pd
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import Point, Polygon, MultiPolygon, GeometryCollection
-from shapely.ops import unary_union
+import pandas as pd
+import pyogrio
+from pyproj import Transformer
+from shapely.geometry import Polygon
+import shapely
 from shapely import make_valid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
 from .constants import (
     SMALL_AREA_THRESHOLD, MEDIUM_AREA_THRESHOLD, LARGE_AREA_THRESHOLD, EXTRA_LARGE_AREA_THRESHOLD,
     DEFAULT_TREES_PER_SMALL_HECTARE, DEFAULT_TREES_PER_MEDIUM_HECTARE, DEFAULT_TREES_PER_LARGE_HECTARE, DEFAULT_TREES_PER_EXTRA_LARGE_HECTARE,
     MAX_TREE_ATTEMPTS, DEFAULT_MAX_TREES_PER_POLYGON, MIN_TREES_PER_POLYGON,
-    HECTARE_TO_SQ_METERS, DEFAULT_RANDOM_SEED, TIMESTAMP_FORMAT,
+    HECTARE_TO_SQ_METERS, METERS_PER_DEGREE, DEFAULT_RANDOM_SEED, TIMESTAMP_FORMAT,
     DEFAULT_ZONE_STYLES, DEFAULT_OSM_BUFFER_DEGREES, DEFAULT_OSM_TIMEOUT,
     DEFAULT_OSM_RETRY_DELAY, DEFAULT_OSM_MAX_RETRIES,
-    CHUNK_SIZE_FEATURES, LARGE_DATASET_THRESHOLD, GC_INTERVAL
+    CHUNK_SIZE_FEATURES, LARGE_DATASET_THRESHOLD, PARALLEL_FOREST_THRESHOLD, PARALLEL_FOREST_CHUNK_SIZE,
+    TRIANGLE_SAMPLING_MAX_FILL, CLIP_CACHE_DIR, CLIP_CACHE_ENV
 )
 from .overpass import fetch_osm_features, get_bounds_from_boundaries
+from .config_cache import load_config_cached
+from .geofile_cache import read_geofile_cached, read_cached_layer, write_cached_layer
+from .contains import contains_batch, polygon_rings, NUMBA_MIN_POINTS
+from .triangles import polygon_triangles, sample_triangles
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# GDAL's vectorized reader; builds columns directly instead of one Python object per feature
+READ_ENGINE = "pyogrio"
+
+# A generated tree before it becomes a GeoJSON feature: (x, y, tree_type, source_polygon_id)
+TreeRow = Tuple[float, float, str, str]
+
 def setup_logging(level=logging.INFO, log_file=None):
     """Configure logging for the application."""
     formatter = logging.Formatter(
@@ -60,19 +85,122 @@ class ValidationError(Exception):
     """Custom exception for data validation errors."""
     pass
 
+def _geometries_to_geojson(geoms: np.ndarray) -> List[Optional[Dict]]:
+    """GeoJSON geometry dicts for an array of geometries, serialized in one GEOS call.
+    
+    Equivalent to [g.__geo_interface__ for g in geoms] (missing geometries
+    become None) without walking each geometry's coordinates in Python.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    return [loads(text) if text is not None else None for text in shapely.to_geojson(geoms)]
+
+
+def _zone_style_properties(style: Dict[str, Any]) -> Dict[str, Any]:
+    """simplestyle output properties for one DEFAULT_ZONE_STYLES entry."""
+    properties = {
+        "stroke": style.get('stroke_color', '#000000'),
+        "stroke-opacity": style.get('stroke_opacity', 1.0)
+    }
+    
+    # Add fill properties if they exist
+    if 'fill_color' in style:
+        properties["fill"] = style['fill_color']
+    if 'fill_opacity' in style:
+        properties["fill-opacity"] = style['fill_opacity']
+    if 'stroke_width' in style:
+        properties["stroke-width"] = style['stroke_width']
+    return properties
+
+
+def _run_chunk(process_func, args: tuple, kwargs: dict, chunk_index: int, chunk: gpd.GeoDataFrame) -> List[Any]:
+    """Run a bound processor method on one chunk.
+    
+    Each chunk reseeds the processor's generator from the resort seed and its
+    index, so chunks never draw the same random stream and the output does
+    not depend on which worker ran them.
+    """
+    processor = process_func.__self__
+    processor.rng = np.random.default_rng([processor._random_seed, chunk_index])
+    return process_func(chunk, *args, **kwargs)
+
+
+# Processor each chunk pool worker runs its chunks on, built by _init_chunk_worker
+_chunk_processor: Optional['ResortProcessor'] = None
+
+
+def _init_chunk_worker(resort_name: str, chunk_config: Dict[str, Any]):
+    """Build this pool worker's processor once from the few settings chunk work reads."""
+    global _chunk_processor
+    _chunk_processor = ResortProcessor(resort_name, config_dict={resort_name: chunk_config}, workers=1)
+
+
+def _run_pooled_chunk(method_name: str, args: tuple, kwargs: dict, chunk_index: int,
+                      chunk: gpd.GeoDataFrame) -> List[Any]:
+    """Run a processor method by name on one chunk in a pool worker."""
+    return _run_chunk(getattr(_chunk_processor, method_name), args, kwargs, chunk_index, chunk)
+
 class ResortProcessor:
-    def __init__(self, resort_name: str, config_file: str = "config/resorts.yaml"):
-        """Initialize with resort name and configuration."""
+    # OSM leaf_type -> standardized tree type; anything else uses the resort default
+    LEAF_TYPE_MAP = {
+        'needleleaved': 'tree:needle',
+        'broadleaved': 'tree:broad',
+        'mixed': 'tree:mixed',
+    }
+    
+    # Normalized ZoneType -> standardized output type
+    ZONE_TYPE_MAP = {
+        'slow_zone': 'zone:slow',
+        'closed_area': 'zone:closed',
+        'ski_area_boundary': 'boundary:ski',
+        'feature_boundary': 'boundary:feature',  # Boundary for tree/rock generation
+        'beginner_area': 'zone:beginner',  # Not in spec but handling it
+        # Add support for first-tracks if it appears in data
+        'first_tracks': 'boundary:first-tracks'
+    }
+    
+    # ZoneType -> styling properties, compiled once from DEFAULT_ZONE_STYLES
+    ZONE_STYLE_PROPERTIES = {
+        zone_type: _zone_style_properties(style) for zone_type, style in DEFAULT_ZONE_STYLES.items()
+    }
+    
+    # OSM natural=* values treated as rock features
+    ROCK_NATURAL_TYPES = np.array(['rock', 'cliff', 'scree', 'bare_rock', 'stone'], dtype=object)
+    
+    # OSM tag values the processors use (forests, rocks, tree nodes) and the
+    # attribute columns they read; load_data skips everything else inside GDAL
+    USED_LANDUSE_TYPES = ('forest', 'quarry')
+    USED_NATURAL_TYPES = ('wood', 'tree', *ROCK_NATURAL_TYPES)
+    USED_FEATURE_COLUMNS = ['landuse', 'natural', 'leaf_type', 'leaf_cycle', '@id']
+    
+    # Lazily built by _get_transformer; pyproj transformers are costly to create
+    _transformer: Optional[Transformer] = None
+    
+    def __init__(self, resort_name: str, config_file: str = "config/resorts.yaml",
+                 config_dict: Optional[Dict[str, Any]] = None, workers: Optional[int] = None):
+        """Initialize with resort name and configuration.
+        
+        Args:
+            resort_name: Key of the resort in the configuration
+            config_file: Path to the resorts YAML file
+            config_dict: Already-parsed configuration; skips loading config_file
+            workers: Processes for parallel chunked work (default: CPU count; 1 runs in-process)
+        """
         self.resort_name = resort_name
-        self.config = self._load_config(config_file)
+        self.workers = workers
+        self.config = config_dict if config_dict is not None else self._load_config(config_file)
         self.resort_config = self._get_resort_config()
         self.feature_boundary = None
+        self._boundary_parts = None
+        
+        # Config values read on hot paths, looked up once
+        self._default_tree_type = self.resort_config.get('default_tree_type', 'tree:mixed')
+        self._random_seed = self.resort_config['tree_config']['random_seed']
+        self.rng = np.random.default_rng(self._random_seed)
         
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load resort configuration from YAML file."""
         try:
-            with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+            return load_config_cached(config_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file {config_file} not found")
         except yaml.YAMLError as e:
@@ -83,7 +211,8 @@ class ResortProcessor:
         if self.resort_name not in self.config:
             raise ValueError(f"Resort '{self.resort_name}' not found in configuration")
         
-        resort_config = self.config[self.resort_name].copy()
+        # Deep copy so defaults/overrides never leak into a shared config dict
+        resort_config = copy.deepcopy(self.config[self.resort_name])
         
         # Apply default tree config values
         tree_config = resort_config.get('tree_config', {})
@@ -112,7 +241,10 @@ class ResortProcessor:
         return resort_config
     
     def validate_input_files(self, validate_only: bool = False) -> Dict[str, Any]:
-        """Validate input files and return validation results."""
+        """Validate input files and return validation results.
+        
+        With validate_only, boundary geometries are also checked for validity.
+        """
         results = {
             'valid': True,
             'errors': [],
@@ -125,7 +257,7 @@ class ResortProcessor:
         
         # Validate boundaries file
         try:
-            boundaries_info = self._validate_boundaries_file(boundaries_file)
+            boundaries_info = self._validate_boundaries_file(boundaries_file, check_geometry=validate_only)
             results['file_info']['boundaries'] = boundaries_info
             logger.info(f"Boundaries file validation: {boundaries_info['features']} features, {len(boundaries_info['zone_types'])} zone types")
         except ValidationError as e:
@@ -157,48 +289,60 @@ class ResortProcessor:
         
         return results
     
-    def _validate_boundaries_file(self, file_path: str) -> Dict[str, Any]:
-        """Validate boundaries GeoJSON file structure and content."""
+    def _validate_boundaries_file(self, file_path: str, check_geometry: bool = False) -> Dict[str, Any]:
+        """Validate boundaries GeoJSON file structure and content.
+        
+        Only the ZoneType attribute is read; geometries are decoded solely when
+        check_geometry is set, to count invalid ones.
+        """
         if not os.path.exists(file_path):
             raise ValidationError(f"File not found: {file_path}")
         
         try:
-            gdf = gpd.read_file(file_path)
+            info = pyogrio.read_info(file_path)
         except Exception as e:
             raise ValidationError(f"Cannot read GeoJSON file: {e}")
         
-        if gdf.empty:
+        if info['features'] == 0:
             raise ValidationError("File contains no features")
         
         # Check required columns
         required_cols = ['ZoneType']
-        missing_cols = [col for col in required_cols if col not in gdf.columns]
+        missing_cols = [col for col in required_cols if col not in info['fields']]
         if missing_cols:
             raise ValidationError(f"Missing required columns: {missing_cols}")
         
+        try:
+            df = pyogrio.read_dataframe(file_path, read_geometry=False, columns=required_cols)
+        except Exception as e:
+            raise ValidationError(f"Cannot read GeoJSON file: {e}")
+        
         # Check for required zone types
-        zone_types = set(gdf['ZoneType'].dropna().unique())
+        zone_types = set(df['ZoneType'].dropna().unique())
         required_zones = {'ski_area_boundary', 'feature_boundary'}
         missing_zones = required_zones - zone_types
         if missing_zones:
             raise ValidationError(f"Missing required zone types: {missing_zones}")
         
-        # Check geometry validity
-        invalid_count = (~gdf.geometry.is_valid).sum()
-        if invalid_count > 0:
-            logger.warning(f"Found {invalid_count} invalid geometries in boundaries file")
+        # Check geometry validity (opt-in: requires decoding every geometry)
+        invalid_count = None
+        if check_geometry:
+            gdf = gpd.read_file(file_path, engine=READ_ENGINE, columns=[])
+            invalid_count = int((~shapely.is_valid(gdf.geometry.to_numpy())).sum())
+            if invalid_count > 0:
+                logger.warning(f"Found {invalid_count} invalid geometries in boundaries file")
         
         return {
-            'features': len(gdf),
+            'features': len(df),
             'zone_types': list(zone_types),
             'invalid_geometries': invalid_count,
-            'crs': str(gdf.crs)
+            'crs': str(info['crs'])
         }
     
     def _validate_osm_file(self, file_path: str) -> Dict[str, Any]:
         """Validate OSM features GeoJSON file structure and content."""
         try:
-            gdf = gpd.read_file(file_path)
+            gdf = read_geofile_cached(file_path)
         except Exception as e:
             raise ValidationError(f"Cannot read OSM file: {e}")
         
@@ -215,7 +359,7 @@ class ResortProcessor:
             feature_types.extend(gdf['leisure'].dropna().unique())
         
         # Check geometry validity
-        invalid_count = (~gdf.geometry.is_valid).sum()
+        invalid_count = int((~shapely.is_valid(gdf.geometry.to_numpy())).sum())
         if invalid_count > 0:
             logger.warning(f"Found {invalid_count} invalid geometries in OSM file")
         
@@ -253,9 +397,10 @@ class ResortProcessor:
         if tree_config['medium_area_threshold'] >= 1000000:  # 100 hectares
             logger.warning("medium_area_threshold is very large, check if this is intended")
     
-    def _should_use_chunked_processing(self, gdf: gpd.GeoDataFrame) -> bool:
+    def _should_use_chunked_processing(self, gdf: gpd.GeoDataFrame,
+                                       threshold: int = LARGE_DATASET_THRESHOLD) -> bool:
         """Determine if chunked processing should be used based on dataset size."""
-        return len(gdf) >= LARGE_DATASET_THRESHOLD
+        return len(gdf) >= threshold
     
     def _chunk_geodataframe(self, gdf: gpd.GeoDataFrame, chunk_size: int = None) -> Generator[gpd.GeoDataFrame, None, None]:
         """Split GeoDataFrame into smaller chunks for memory-efficient processing."""
@@ -267,7 +412,8 @@ class ResortProcessor:
         
         for i in range(0, total_rows, chunk_size):
             end_idx = min(i + chunk_size, total_rows)
-            chunk = gdf.iloc[i:end_idx].copy()
+            # A view is enough: chunk consumers (generate_tree_points) only read rows
+            chunk = gdf.iloc[i:end_idx]
             logger.debug(f"Processing chunk {i//chunk_size + 1}/{(total_rows + chunk_size - 1)//chunk_size} ({len(chunk)} features)")
             yield chunk
             
@@ -276,31 +422,58 @@ class ResortProcessor:
                 gc.collect()
     
     def _process_with_memory_management(self, gdf: gpd.GeoDataFrame, 
-                                      process_func, *args, **kwargs) -> List[Dict]:
-        """Process GeoDataFrame with memory management for large datasets."""
-        if not self._should_use_chunked_processing(gdf):
+                                      process_func, *args,
+                                      threshold: int = LARGE_DATASET_THRESHOLD,
+                                      chunk_size: Optional[int] = None, **kwargs) -> List[Any]:
+        """Process GeoDataFrame with memory management for large datasets.
+        
+        Datasets of at least threshold rows are split into chunks that run in
+        parallel on a process pool (results keep chunk order). process_func
+        must be a method of this processor that only reads the resort's
+        tree_config and default tree type: pool workers rebuild a processor
+        from just those settings, so tasks carry only their chunk. Each chunk
+        is seeded from its index, so the output is the same for any worker count.
+        """
+        if not self._should_use_chunked_processing(gdf, threshold):
             # Small dataset - process normally
             return process_func(gdf, *args, **kwargs)
         
-        # Large dataset - use chunked processing
-        logger.info("Using chunked processing for memory efficiency")
-        all_results = []
-        processed_count = 0
+        chunks = self._chunk_geodataframe(gdf, chunk_size)
+        workers = self.workers or os.cpu_count()
+        
+        # Daemonic processes (e.g. multiprocessing.Pool workers) cannot start
+        # their own pool, and forking from a worker thread (batch thread
+        # executor) copies other threads' locks mid-use
+        if (workers <= 1 or multiprocessing.current_process().daemon
+                or threading.current_thread() is not threading.main_thread()):
+            logger.info("Using sequential chunked processing")
+            chunk_results = (
+                _run_chunk(process_func, args, kwargs, chunk_index, chunk)
+                for chunk_index, chunk in enumerate(chunks)
+            )
+            return self._collect_chunk_results(gdf, chunk_results)
         
-        for chunk in self._chunk_geodataframe(gdf):
-            chunk_results = process_func(chunk, *args, **kwargs)
-            all_results.extend(chunk_results)
-            
-            processed_count += len(chunk)
-            
-            # Periodic garbage collection
-            if processed_count % GC_INTERVAL == 0:
-                gc.collect()
-                logger.debug(f"Memory cleanup after processing {processed_count} features")
+        logger.info(f"Using parallel chunked processing on {workers} processes")
+        chunk_config = {
+            'tree_config': self.resort_config['tree_config'],
+            'default_tree_type': self._default_tree_type,
+        }
+        run_chunk = functools.partial(_run_pooled_chunk, process_func.__name__, args, kwargs)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_chunk_worker,
+                                 initargs=(self.resort_name, chunk_config)) as executor:
+            chunk_results = executor.map(run_chunk, itertools.count(), chunks)
+            return self._collect_chunk_results(gdf, chunk_results)
+    
+    def _collect_chunk_results(self, gdf: gpd.GeoDataFrame, chunk_results: Iterator[List[Any]]) -> List[Any]:
+        """Concatenate per-chunk results in chunk order."""
+        chunk_results = list(chunk_results)
+        processed_chunks = len(chunk_results)
+        all_results = list(itertools.chain.from_iterable(chunk_results))
+        del chunk_results
         
         # Final cleanup
         gc.collect()
-        logger.info(f"Completed processing {processed_count} features with {len(all_results)} results")
+        logger.info(f"Completed processing {len(gdf)} features in {processed_chunks} chunks with {len(all_results)} results")
         
         return all_results
     
@@ -311,7 +484,7 @@ class ResortProcessor:
         if not os.path.exists(boundaries_file):
             raise FileNotFoundError(f"Boundary file not found: {boundaries_file}")
         
-        boundaries_gdf = gpd.read_file(boundaries_file)
+        boundaries_gdf = read_geofile_cached(boundaries_file)
         
         # Check for None/null ZoneType values before normalization
         null_zone_mask = boundaries_gdf['ZoneType'].isna()
@@ -326,11 +499,17 @@ class ResortProcessor:
             )
             raise ValueError(error_msg)
         
-        # Normalize ZoneType values (handle case and spacing variations)
-        boundaries_gdf['ZoneType'] = boundaries_gdf['ZoneType'].str.lower().str.replace(' ', '_')
+        # Normalize ZoneType values (handle case and spacing variations).
+        # There are only a handful of distinct zone types, so normalize each
+        # once and store the column as a categorical of small integer codes
+        zone_mapping = {
+            zone: zone.lower().replace(' ', '_') if isinstance(zone, str) else zone
+            for zone in boundaries_gdf['ZoneType'].unique()
+        }
+        boundaries_gdf['ZoneType'] = boundaries_gdf['ZoneType'].map(zone_mapping).astype('category')
         
         # Check what zone types are present
-        zone_types = boundaries_gdf['ZoneType'].unique()
+        zone_types = list(boundaries_gdf['ZoneType'].cat.categories)
         print(f"Found zone types: {', '.join(zone_types)}")
         
         # Check for required ski_area_boundary
@@ -356,7 +535,8 @@ class ResortProcessor:
             raise ValueError(error_msg)
         
         # Union all feature_boundary geometries
-        boundary_union = feature_boundary_features.geometry.union_all()
+        # (one GEOS UnaryUnion over the whole array, independent of the geopandas version)
+        boundary_union = shapely.union_all(feature_boundary_features.geometry.to_numpy())
         
         # Validate that feature_boundary is a proper area geometry (Polygon)
         if boundary_union.geom_type in ['LineString', 'MultiLineString']:
@@ -381,7 +561,15 @@ class ResortProcessor:
             )
             raise ValueError(error_msg)
         
+        # Prepare once: every later contains/intersects test against the boundary
+        # (clipping, OSM tree containment) reuses the GEOS spatial index
+        shapely.prepare(boundary_union)
         self.feature_boundary = boundary_union
+        
+        # Its disjoint polygon parts, so clipping can intersect a feature with
+        # just the part it touches rather than the whole multi-part boundary
+        self._boundary_parts = shapely.get_parts(boundary_union)
+        shapely.prepare(self._boundary_parts)
         logger.info(f"Using feature_boundary ({self.feature_boundary.geom_type}) for clipping OSM features (forests/rocks)")
         
         # Check if OSM file exists and has content, fetch from Overpass if not
@@ -392,9 +580,9 @@ class ResortProcessor:
             should_fetch = True
         else:
             # Check if file is empty or just has empty FeatureCollection
+            # (read_info reports the feature count without reading any features)
             try:
-                temp_gdf = gpd.read_file(features_file)
-                if temp_gdf.empty:
+                if pyogrio.read_info(features_file)['features'] == 0:
                     logger.info("OSM features file is empty, fetching from Overpass API...")
                     should_fetch = True
             except (FileNotFoundError, ValueError, Exception) as e:
@@ -407,12 +595,23 @@ class ResortProcessor:
             
             # Fetch OSM features (will be saved to the expected location)
             logger.info(f"Fetching OSM data for {self.resort_name}...")
-            features_file = fetch_osm_features(self.resort_name, bounds)
+            features_file = fetch_osm_features(self.resort_name, bounds, self.workers)
         
-        features_gdf = gpd.read_file(features_file)
+        features_gdf = read_geofile_cached(
+            features_file, columns=self.USED_FEATURE_COLUMNS, where=self._used_features_filter(features_file)
+        )
         
         return boundaries_gdf, features_gdf
     
+    def _used_features_filter(self, features_file: str) -> Optional[str]:
+        """SQL attribute filter keeping only OSM features some processor uses."""
+        fields = set(pyogrio.read_info(features_file)['fields'])
+        clauses = []
+        for field, values in (('landuse', self.USED_LANDUSE_TYPES), ('natural', self.USED_NATURAL_TYPES)):
+            if field in fields:
+                clauses.append(f'"{field}" IN ({", ".join(repr(str(value)) for value in values)})')
+        return " OR ".join(clauses) if clauses else None
+    
     def clip_to_boundary(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """Clip all features to the feature boundary using optimized spatial operations."""
         if self.feature_boundary is None:
@@ -424,32 +623,36 @@ class ResortProcessor:
         initial_count = len(gdf)
         
         try:
+            geoms = gdf.geometry.to_numpy()
+            
             # Fix invalid geometries before clipping (vectorized operation)
-            invalid_mask = ~gdf.geometry.is_valid
+            invalid_mask = ~shapely.is_valid(geoms)
             if invalid_mask.any():
                 logger.debug(f"Fixing {invalid_mask.sum()} invalid geometries")
-                gdf.loc[invalid_mask, 'geometry'] = gdf.loc[invalid_mask, 'geometry'].apply(make_valid)
+                geoms = geoms.copy()
+                geoms[invalid_mask] = shapely.make_valid(geoms[invalid_mask])
             
-            # Use spatial index for faster intersection checks
-            # First, filter features that intersect with the boundary (much faster than clipping everything)
-            spatial_index = gdf.sindex
-            boundary_bounds = self.feature_boundary.bounds
-            possible_matches_index = list(spatial_index.intersection(boundary_bounds))
+            # Use an STRtree to find features that actually intersect the boundary,
+            # then clip only those in a single vectorized GEOS call
+            tree = shapely.STRtree(geoms)
+            candidate_idx = np.sort(tree.query(self.feature_boundary, predicate='intersects'))
             
-            if not possible_matches_index:
+            if len(candidate_idx) == 0:
                 logger.info(f"Clipped {initial_count} features to feature_boundary, kept 0 (no spatial intersection)")
                 return gpd.GeoDataFrame(columns=gdf.columns, crs=gdf.crs)
             
-            possible_matches = gdf.iloc[possible_matches_index]
-            
-            # Create a GeoDataFrame for the boundary to use with overlay
-            boundary_gdf = gpd.GeoDataFrame([1], geometry=[self.feature_boundary], crs=gdf.crs)
+            # Features entirely inside the (prepared) boundary are kept as they
+            # are; only those crossing its edge pay for an intersection
+            clipped_geoms = geoms[candidate_idx]
+            crossing = ~shapely.contains(self.feature_boundary, clipped_geoms)
+            if crossing.any():
+                clipped_geoms[crossing] = self._intersect_boundary(clipped_geoms[crossing])
             
-            # Perform actual clipping only on features that might intersect
-            clipped_gdf = gpd.overlay(possible_matches, boundary_gdf, how='intersection', keep_geom_type=False)
+            clipped_gdf = gdf.iloc[candidate_idx].reset_index(drop=True)
+            clipped_gdf[gdf.geometry.name] = gpd.GeoSeries(clipped_geoms, index=clipped_gdf.index, crs=gdf.crs)
             
             # Remove empty or zero-area geometries
-            valid_mask = (~clipped_gdf.geometry.is_empty) & (clipped_gdf.geometry.area > 0)
+            valid_mask = ~shapely.is_empty(clipped_geoms) & (shapely.area(clipped_geoms) > 0)
             clipped_gdf = clipped_gdf[valid_mask]
             
             logger.info(f"Clipped {initial_count} features to feature_boundary, kept {len(clipped_gdf)} (spatial indexing)")
@@ -459,15 +662,70 @@ class ResortProcessor:
             logger.warning(f"Spatial indexing failed ({e}), falling back to row-by-row clipping")
             return self._clip_to_boundary_fallback(gdf)
     
+    def _intersect_boundary(self, geoms: np.ndarray) -> np.ndarray:
+        """Intersect geometries with the feature boundary, one vectorized GEOS call per case.
+        
+        With a multi-part boundary, a geometry meeting only one part is
+        intersected with that part alone (the same result, since the parts are
+        disjoint), so GEOS never walks the vertices of parts far away from it.
+        """
+        parts = self._boundary_parts
+        if parts is None or len(parts) < 2:
+            return shapely.intersection(geoms, self.feature_boundary)
+        
+        geom_idx, part_idx = shapely.STRtree(parts).query(geoms, predicate='intersects')
+        single = np.bincount(geom_idx, minlength=len(geoms)) == 1
+        touched_part = np.zeros(len(geoms), dtype=np.intp)
+        touched_part[geom_idx] = part_idx
+        
+        result = np.empty(len(geoms), dtype=object)
+        result[single] = shapely.intersection(geoms[single], parts[touched_part[single]])
+        result[~single] = shapely.intersection(geoms[~single], self.feature_boundary)
+        return result
+    
+    def _clip_cache_key(self, layer: str, gdf: gpd.GeoDataFrame) -> str:
+        """Hash the resort, layer, its columns and the input files' revisions."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.resort_name}\0{layer}\0{list(gdf.columns)}".encode('utf-8'))
+        for key in ('boundaries', 'osm_features'):
+            path = self.resort_config['data_files'][key]
+            stat = os.stat(path)
+            digest.update(f"\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _clip_to_boundary_cached(self, layer: str, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """clip_to_boundary, reusing the layer clipped by an earlier run when caching is enabled.
+        
+        Opt in with GEOWELD_CACHE=1. Clipped layers are stored under
+        .cache/clip/ and keyed on both input files' mtime and size, so editing
+        or re-fetching either one invalidates them.
+        """
+        if os.environ.get(CLIP_CACHE_ENV) != '1':
+            return self.clip_to_boundary(gdf)
+        
+        cache_file = Path(CLIP_CACHE_DIR) / f"{self._clip_cache_key(layer, gdf)}.gpkg"
+        cached = read_cached_layer(cache_file)
+        if cached is not None:
+            logger.info(f"Reusing {len(cached)} clipped {layer} features from {cache_file}")
+            return cached
+        
+        clipped_gdf = self.clip_to_boundary(gdf)
+        write_cached_layer(cache_file, clipped_gdf)
+        return clipped_gdf
+    
     def _clip_to_boundary_fallback(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
-        """Fallback method for clipping when spatial indexing fails."""
-        clipped_features = []
+        """Fallback method for clipping when spatial indexing fails.
+        
+        Clips one geometry at a time so a single failing feature is skipped
+        instead of failing the whole batch.
+        """
         initial_count = len(gdf)
+        kept_positions = []
+        clipped_geoms = []
         
-        for idx, row in gdf.iterrows():
+        for position, geom in enumerate(gdf.geometry.to_numpy()):
             try:
                 # Fix invalid geometries before clipping
-                geom = row.geometry
                 if not geom.is_valid:
                     geom = make_valid(geom)
                 
@@ -475,46 +733,65 @@ class ResortProcessor:
                 
                 # Only keep non-empty geometries
                 if not clipped_geom.is_empty and clipped_geom.area > 0:
-                    new_row = row.copy()
-                    new_row.geometry = clipped_geom
-                    clipped_features.append(new_row)
+                    kept_positions.append(position)
+                    clipped_geoms.append(clipped_geom)
             except Exception as e:
-                logger.warning(f"Failed to clip feature {idx}: {e}")
+                logger.warning(f"Failed to clip feature {gdf.index[position]}: {e}")
                 continue
         
-        logger.info(f"Clipped {initial_count} features to feature_boundary, kept {len(clipped_features)} (fallback)")
+        logger.info(f"Clipped {initial_count} features to feature_boundary, kept {len(kept_positions)} (fallback)")
         
-        if not clipped_features:
+        if not kept_positions:
             return gpd.GeoDataFrame(columns=gdf.columns, crs=gdf.crs)
         
-        return gpd.GeoDataFrame(clipped_features, crs=gdf.crs)
+        kept_gdf = gdf.iloc[kept_positions]
+        return kept_gdf.assign(**{
+            gdf.geometry.name: gpd.GeoSeries(clipped_geoms, index=kept_gdf.index, crs=gdf.crs)
+        })
     
     def calculate_tree_count(self, area_sq_meters: float) -> int:
         """Calculate number of trees to place based on polygon area with tiered density."""
+        return int(self.calculate_tree_counts_bulk([area_sq_meters])[0])
+    
+    @classmethod
+    def _get_transformer(cls) -> Transformer:
+        """Shared WGS84 -> Web Mercator transformer, built on first use."""
+        if cls._transformer is None:
+            cls._transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+        return cls._transformer
+    
+    def _project_to_web_mercator(self, geoms: np.ndarray) -> np.ndarray:
+        """Project an array of WGS84 geometries to EPSG:3857 in one coordinate transform."""
+        transformer = self._get_transformer()
+        return shapely.transform(
+            geoms, lambda coords: np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+        )
+    
+    def calculate_tree_counts_bulk(self, areas_sq_meters: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_tree_count for an array of areas in square meters."""
         tree_config = self.resort_config['tree_config']
-        
-        if area_sq_meters < tree_config['min_area_for_trees']:
-            return 0
-        
-        hectares = area_sq_meters / HECTARE_TO_SQ_METERS
-        
-        # Use tiered density based on area size
-        if area_sq_meters <= tree_config['small_area_threshold']:
-            trees_per_hectare = tree_config['trees_per_small_hectare']
-        elif area_sq_meters <= tree_config['medium_area_threshold']:
-            trees_per_hectare = tree_config['trees_per_medium_hectare']
-        elif area_sq_meters <= tree_config['large_area_threshold']:
-            trees_per_hectare = tree_config['trees_per_large_hectare']
-        else:
-            trees_per_hectare = tree_config['trees_per_extra_large_hectare']
-        
-        tree_count = int(hectares * trees_per_hectare)
+        areas = np.asarray(areas_sq_meters, dtype=np.float64)
+        
+        # Tier upper bounds are inclusive, as in calculate_tree_count
+        thresholds = np.array([
+            tree_config['small_area_threshold'],
+            tree_config['medium_area_threshold'],
+            tree_config['large_area_threshold'],
+        ], dtype=np.float64)
+        densities = np.array([
+            tree_config['trees_per_small_hectare'],
+            tree_config['trees_per_medium_hectare'],
+            tree_config['trees_per_large_hectare'],
+            tree_config['trees_per_extra_large_hectare'],
+        ], dtype=np.float64)
+        
+        tiers = np.digitize(areas, thresholds, right=True)
+        counts = (areas / HECTARE_TO_SQ_METERS * densities[tiers]).astype(np.int64)
         
         # Apply min/max constraints
-        tree_count = max(tree_config['min_trees_per_polygon'], tree_count)
-        tree_count = min(tree_config['max_trees_per_polygon'], tree_count)
-        
-        return tree_count
+        counts = np.clip(counts, tree_config['min_trees_per_polygon'], tree_config['max_trees_per_polygon'])
+        counts[areas < tree_config['min_area_for_trees']] = 0
+        return counts
     
     def _calculate_area_in_sq_meters(self, geometry) -> float:
         """Calculate geometry area in square meters using proper projection."""
@@ -522,63 +799,109 @@ class ResortProcessor:
             return 0.0
         
         try:
-            # Ensure geometry is valid
-            if not geometry.is_valid:
-                geometry = geometry.buffer(0)  # Fix invalid geometry
-                if not geometry.is_valid:
-                    return 0.0
-            
-            # More efficient area calculation using Shapely's built-in projection
-            # For rough area estimation, use a simplified approach when geometry is small
-            bounds = geometry.bounds
-            if bounds[2] - bounds[0] < 0.01 and bounds[3] - bounds[1] < 0.01:  # Small geometries
-                # Use approximate conversion for small areas (faster)
-                # At mid-latitudes, 1 degree ≈ 111km, so 1 sq degree ≈ 12321 km²
-                lat_center = (bounds[1] + bounds[3]) / 2
-                area_degrees = geometry.area
-                # Adjust for latitude (cos correction)
-                import math
-                cos_lat = math.cos(math.radians(lat_center))
-                area_sq_meters = area_degrees * 111320 * 111320 * cos_lat  # More accurate conversion
-                return area_sq_meters
-            else:
-                # Use proper projection for larger geometries
-                temp_gdf = gpd.GeoDataFrame([1], geometry=[geometry], crs='EPSG:4326')
-                temp_gdf_proj = temp_gdf.to_crs('EPSG:3857')
-                return temp_gdf_proj.geometry.area.iloc[0]
-                
+            return float(self._calculate_areas_bulk([geometry])[0])
         except Exception as e:
             logger.warning(f"Failed to calculate area for geometry: {e}")
             return 0.0
     
-    def generate_random_points_in_polygon(self, polygon: Polygon, num_points: int) -> List[Point]:
-        """Generate random points within a polygon using adaptive sampling strategies."""
+    @staticmethod
+    def _calculate_areas_small_bulk(areas_deg: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """Approximate square meters from square degrees for small geometries.
+        
+        1 degree ≈ 111km; longitude is scaled by the cosine of each geometry's
+        center latitude, taken from its (N, 4) bounds array.
+        """
+        lat_centers = (bounds[:, 1] + bounds[:, 3]) / 2
+        return areas_deg * (METERS_PER_DEGREE * METERS_PER_DEGREE) * np.cos(np.deg2rad(lat_centers))
+    
+    def _calculate_areas_bulk(self, geoms) -> np.ndarray:
+        """Calculate areas in square meters for many geometries at once.
+        
+        Matches _calculate_area_in_sq_meters: invalid geometries are repaired
+        with buffer(0) (0.0 if still invalid), small geometries use a
+        latitude-corrected degree conversion and the rest are projected to
+        EPSG:3857 with a single shared transformer.
+        """
+        geoms = np.asarray(geoms, dtype=object)
+        areas = np.zeros(len(geoms), dtype=np.float64)
+        
+        present = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+        if not present.any():
+            return areas
+        
+        # Ensure geometries are valid
+        geoms = geoms.copy()
+        invalid = present & ~shapely.is_valid(geoms)
+        if invalid.any():
+            geoms[invalid] = shapely.buffer(geoms[invalid], 0)  # Fix invalid geometry
+            present &= shapely.is_valid(geoms)
+        
+        # For rough area estimation, use a simplified approach when geometry is small
+        bounds = shapely.bounds(geoms)
+        small = present & (bounds[:, 2] - bounds[:, 0] < 0.01) & (bounds[:, 3] - bounds[:, 1] < 0.01)
+        large = present & ~small
+        
+        if small.any():
+            areas[small] = self._calculate_areas_small_bulk(shapely.area(geoms[small]), bounds[small])
+        
+        if large.any():
+            # Use proper projection for larger geometries
+            areas[large] = shapely.area(self._project_to_web_mercator(geoms[large]))
+        
+        return areas
+    
+    def generate_random_points_in_polygon(self, polygon: Polygon, num_points: int,
+                                          bounds: Optional[Tuple[float, float, float, float]] = None,
+                                          area: Optional[float] = None) -> np.ndarray:
+        """Generate random points within a polygon using adaptive sampling strategies.
+        
+        bounds and area may be passed in when they were already computed in
+        bulk; every sampling strategy below needs them.
+        
+        Returns:
+            (N, 2) float array of x, y coordinates, N <= num_points
+        """
         if num_points <= 0:
-            return []
+            return np.empty((0, 2))
+        
+        if bounds is None:
+            bounds = polygon.bounds
+        if area is None:
+            area = polygon.area
+        
+        # Grid and rejection sampling both test many candidates against the
+        # polygon; preparing it once lets every contains_xy call reuse GEOS's
+        # edge index instead of scanning all vertices per point
+        shapely.prepare(polygon)
         
         # Try grid-based sampling first for efficiency
         try:
-            points = self._grid_based_sampling(polygon, num_points)
+            points = self._grid_based_sampling(polygon, num_points, bounds, area)
             if len(points) >= num_points * 0.8:  # If we get 80% or more, we're good
                 return points[:num_points]
         except Exception:
             pass
         
+        # Thin or irregular polygons reject most bounding-box candidates;
+        # sample their triangulation directly, which never misses
+        points = self._triangle_sampling(polygon, num_points, bounds, area)
+        if points is not None:
+            return points
+        
         # Fall back to rejection sampling with adaptive bounds
-        points = self._rejection_sampling_adaptive(polygon, num_points)
+        points = self._rejection_sampling_adaptive(polygon, num_points, bounds, area)
         
         if len(points) < num_points:
             logger.warning(f"Only generated {len(points)} trees out of {num_points} requested")
         
         return points
     
-    def _grid_based_sampling(self, polygon: Polygon, num_points: int) -> List[Point]:
+    def _grid_based_sampling(self, polygon: Polygon, num_points: int,
+                             bounds: Tuple[float, float, float, float], polygon_area: float) -> np.ndarray:
         """Generate points using a grid-based approach for better distribution."""
-        bounds = polygon.bounds
         min_x, min_y, max_x, max_y = bounds
         
         # Calculate approximate grid size based on area and desired points
-        polygon_area = polygon.area
         point_density = num_points / polygon_area
         grid_spacing = 1.0 / (point_density ** 0.5) if point_density > 0 else 0.01
         
@@ -586,38 +909,55 @@ class ResortProcessor:
         grid_spacing = max(grid_spacing, (max_x - min_x) / 50)  # At least 50 points across width
         grid_spacing = min(grid_spacing, (max_x - min_x) / 10)   # At most 10 points across width
         
-        points = []
-        x = min_x
-        while x <= max_x and len(points) < num_points * 2:  # Generate extra candidates
-            y = min_y
-            while y <= max_y and len(points) < num_points * 2:
-                # Add some randomness to grid positions
-                jitter_x = random.uniform(-grid_spacing * 0.3, grid_spacing * 0.3)
-                jitter_y = random.uniform(-grid_spacing * 0.3, grid_spacing * 0.3)
-                point = Point(x + jitter_x, y + jitter_y)
-                
-                if polygon.contains(point):
-                    points.append(point)
-                
-                y += grid_spacing
-            x += grid_spacing
+        if grid_spacing <= 0:
+            return np.empty((0, 2))
+        
+        # Build the whole jittered grid at once (x-major, like walking columns left to right)
+        grid_x = min_x + grid_spacing * np.arange(int((max_x - min_x) / grid_spacing) + 1)
+        grid_y = min_y + grid_spacing * np.arange(int((max_y - min_y) / grid_spacing) + 1)
+        xs, ys = np.meshgrid(grid_x, grid_y, indexing='ij')
+        
+        # Add some randomness to grid positions
+        xs = xs.ravel() + self.rng.uniform(-grid_spacing * 0.3, grid_spacing * 0.3, xs.size)
+        ys = ys.ravel() + self.rng.uniform(-grid_spacing * 0.3, grid_spacing * 0.3, ys.size)
+        
+        mask = shapely.contains_xy(polygon, xs, ys)
+        candidates = np.column_stack((xs[mask], ys[mask]))[:num_points * 2]  # Keep extra candidates
         
         # Randomly sample from candidates to get desired number
-        if len(points) > num_points:
-            import random
-            points = random.sample(points, num_points)
+        if len(candidates) > num_points:
+            candidates = candidates[self.rng.choice(len(candidates), size=num_points, replace=False)]
         
-        return points
+        return candidates
     
-    def _rejection_sampling_adaptive(self, polygon: Polygon, num_points: int) -> List[Point]:
-        """Improved rejection sampling with adaptive bounding and early termination."""
-        points = []
-        bounds = polygon.bounds
+    def _triangle_sampling(self, polygon: Polygon, num_points: int,
+                           bounds: Tuple[float, float, float, float], polygon_area: float) -> Optional[np.ndarray]:
+        """Sample exactly num_points from the polygon's triangulation.
+        
+        Returns None when the polygon fills enough of its bounding box for
+        rejection sampling to be cheap, or cannot be triangulated.
+        """
         min_x, min_y, max_x, max_y = bounds
+        bbox_area = (max_x - min_x) * (max_y - min_y)
+        if bbox_area <= 0 or polygon_area / bbox_area >= TRIANGLE_SAMPLING_MAX_FILL:
+            return None
+        
+        triangles = polygon_triangles(polygon)
+        if triangles is None:
+            return None
+        
+        return sample_triangles(triangles, num_points, self.rng)
+    
+    def _rejection_sampling_adaptive(self, polygon: Polygon, num_points: int,
+                                     bounds: Tuple[float, float, float, float], polygon_area: float) -> np.ndarray:
+        """Vectorized rejection sampling with adaptive batch sizes and early termination."""
+        min_x, min_y, max_x, max_y = bounds
+        
+        if not polygon.is_valid:
+            return np.empty((0, 2))
         
         # Calculate polygon efficiency (area ratio) to adjust max attempts
         bbox_area = (max_x - min_x) * (max_y - min_y)
-        polygon_area = polygon.area
         efficiency = polygon_area / bbox_area if bbox_area > 0 else 0.1
         
         # Adjust max attempts based on polygon complexity
@@ -625,32 +965,70 @@ class ResortProcessor:
         max_attempts = int(num_points * base_attempts / max(efficiency, 0.1))
         max_attempts = min(max_attempts, num_points * 500)  # Cap at 500 attempts per point
         
-        attempts = 0
-        consecutive_failures = 0
+        # Large batches go through the numba ray-casting kernel when it is available
+        if contains_batch is not None and num_points > NUMBA_MIN_POINTS:
+            ring_coords, ring_offsets = polygon_rings(polygon)
+            contains = lambda xs, ys: contains_batch(ring_coords, ring_offsets, xs, ys)
+        else:
+            contains = lambda xs, ys: shapely.contains_xy(polygon, xs, ys)
         
-        while len(points) < num_points and attempts < max_attempts:
-            x = random.uniform(min_x, max_x)
-            y = random.uniform(min_y, max_y)
-            point = Point(x, y)
+        # First batch sized so that, at the expected hit rate, it usually suffices
+        batch_size = int(num_points / max(efficiency, 0.1) * 1.2) + 1
+        accepted = []
+        accepted_count = 0
+        attempts = 0
+        misses = 0
+        
+        while accepted_count < num_points and attempts < max_attempts:
+            size = min(batch_size, max_attempts - attempts)
+            xs = self.rng.uniform(min_x, max_x, size)
+            ys = self.rng.uniform(min_y, max_y, size)
+            mask = contains(xs, ys)
+            hits = int(mask.sum())
+            attempts += size
             
-            try:
-                if polygon.is_valid and polygon.contains(point):
-                    points.append(point)
-                    consecutive_failures = 0
-                else:
-                    consecutive_failures += 1
-                    
+            if hits:
+                accepted.append(np.column_stack((xs[mask], ys[mask])))
+                accepted_count += hits
+                misses = 0
+            else:
+                misses += size
                 # Early termination if we're not making progress
-                if consecutive_failures > num_points * 50:
+                if misses > num_points * 50:
                     break
-                    
-            except Exception:
-                consecutive_failures += 1
-                continue
             
-            attempts += 1
+            batch_size *= 2
         
-        return points
+        if not accepted:
+            return np.empty((0, 2))
+        
+        return np.concatenate(accepted)[:num_points]
+    
+    @staticmethod
+    def _select_rows(gdf: gpd.GeoDataFrame, mask: np.ndarray, columns: List[str]) -> gpd.GeoDataFrame:
+        """Masked rows restricted to the geometry and whichever of columns exist.
+        
+        OSM frames carry a column per tag; dropping the unused ones keeps the
+        clip and the pickles sent to chunk workers small.
+        """
+        keep = [column for column in columns if column in gdf.columns] + [gdf.geometry.name]
+        return gdf.iloc[np.flatnonzero(mask), gdf.columns.get_indexer(keep)]
+    
+    @staticmethod
+    def _column_values(gdf: gpd.GeoDataFrame, column: str, default: Any = None) -> List[Any]:
+        """Materialize a column as a plain list, or a list of defaults if it is absent.
+        
+        A non-None default also replaces missing values (NaN/None) in the column.
+        """
+        if column not in gdf.columns:
+            return [default] * len(gdf)
+        values = gdf[column]
+        if default is not None:
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Categoricals (ZoneType) refuse a fill value outside their categories
+                values = values.astype(object)
+            values = values.fillna(default)
+        return values.tolist()
     
     def _map_tree_type(self, leaf_type: Optional[str], leaf_cycle: Optional[str] = None, default_type: str = 'tree:mixed') -> str:
         """Map OSM leaf_type to standardized tree type.
@@ -663,335 +1041,385 @@ class ResortProcessor:
         Returns:
             Standardized tree type (tree:needle, tree:broad, or tree:mixed)
         """
-        if leaf_type == 'needleleaved':
-            return 'tree:needle'
-        elif leaf_type == 'broadleaved':
-            return 'tree:broad'
-        elif leaf_type == 'mixed':
-            return 'tree:mixed'
-        else:
-            # Use resort-specific default when leaf_type is not defined
-            return default_type
+        # Use resort-specific default when leaf_type is not defined
+        return self.LEAF_TYPE_MAP.get(leaf_type, default_type)
+    
+    def _map_tree_types(self, gdf: gpd.GeoDataFrame, default_type: str = 'tree:mixed') -> List[str]:
+        """Vectorized _map_tree_type over a frame's leaf_type column."""
+        if 'leaf_type' not in gdf.columns:
+            return [default_type] * len(gdf)
+        return gdf['leaf_type'].map(self.LEAF_TYPE_MAP).fillna(default_type).tolist()
     
     def process_osm_tree_nodes(self, features_gdf: gpd.GeoDataFrame) -> List[Dict]:
         """Process OSM tree nodes (actual tree points from OSM data)."""
-        tree_features = []
-        
         # Check if the dataframe is empty
         if features_gdf.empty:
             return []
         
         # Filter for tree nodes (check if columns exist first)
-        tree_mask = pd.Series([False] * len(features_gdf), index=features_gdf.index)
+        tree_mask = np.zeros(len(features_gdf), dtype=bool)
         
         if 'natural' in features_gdf.columns:
-            tree_mask = (features_gdf['natural'] == 'tree')
+            tree_mask = features_gdf['natural'].to_numpy() == 'tree'
         
         # Also check if geometry is Point type
-        if any(tree_mask):
-            tree_mask &= features_gdf.geometry.geom_type == 'Point'
+        if tree_mask.any():
+            tree_mask &= shapely.get_type_id(features_gdf.geometry.to_numpy()) == shapely.GeometryType.POINT
         
-        tree_gdf = features_gdf[tree_mask].copy()
+        tree_gdf = self._select_rows(features_gdf, tree_mask, ['leaf_type', '@id'])
         
         if tree_gdf.empty:
             return []
         
-        # Process each tree node
-        for idx, row in tree_gdf.iterrows():
-            point = row.geometry
-            
-            # Clip to feature boundary
-            if self.feature_boundary is not None:
-                if not self.feature_boundary.contains(point):
-                    continue
-            
-            # Map leaf_type to standardized tree type
-            leaf_type = row.get('leaf_type')
-            leaf_cycle = row.get('leaf_cycle')
-            tree_type = self._map_tree_type(leaf_type, leaf_cycle, self.resort_config.get('default_tree_type', 'tree:mixed'))
-            
-            tree_feature = {
+        geoms = tree_gdf.geometry.to_numpy()
+        xs = shapely.get_x(geoms)
+        ys = shapely.get_y(geoms)
+        
+        # Clip to feature boundary with one vectorized containment test
+        if self.feature_boundary is not None:
+            inside = shapely.contains_xy(self.feature_boundary, xs, ys)
+            tree_gdf = tree_gdf[inside]
+            xs = xs[inside]
+            ys = ys[inside]
+        
+        # Map leaf_type to standardized tree type
+        tree_types = self._map_tree_types(tree_gdf, self._default_tree_type)
+        osm_ids = self._column_values(tree_gdf, '@id', '')
+        
+        return [
+            {
                 "type": "Feature",
                 "geometry": {
                     "type": "Point",
-                    "coordinates": [point.x, point.y]
+                    "coordinates": [x, y]
                 },
                 "properties": {
                     "trees": True,
                     "type": tree_type,
                     "source": "osm",
-                    "@id": row.get('@id', '')
+                    "@id": osm_id
                 }
             }
-            tree_features.append(tree_feature)
-        
-        return tree_features
+            for x, y, tree_type, osm_id in zip(xs.tolist(), ys.tolist(), tree_types, osm_ids)
+        ]
     
     def _extract_valid_polygons(self, geometry) -> List[Polygon]:
         """Extract valid polygons from a geometry (Polygon, MultiPolygon, or GeometryCollection)."""
-        if isinstance(geometry, MultiPolygon):
-            return [poly for poly in geometry.geoms if isinstance(poly, Polygon)]
-        elif isinstance(geometry, Polygon):
-            return [geometry]
-        elif isinstance(geometry, GeometryCollection):
-            # Handle GeometryCollection (result of make_valid on complex geometries)
-            polygons = []
-            for geom in geometry.geoms:
-                if isinstance(geom, Polygon):
-                    polygons.append(geom)
-                elif isinstance(geom, MultiPolygon):
-                    polygons.extend([poly for poly in geom.geoms if isinstance(poly, Polygon)])
-            return polygons
-        else:
+        if geometry is None:
             return []
+        
+        parts, _ = self._explode_polygons([geometry])
+        return parts.tolist()
     
-    def _distribute_trees_across_polygons(self, polygons: List[Polygon], total_tree_count: int) -> List[int]:
-        """Distribute trees across polygons proportionally by area."""
-        polygon_areas = [self._calculate_area_in_sq_meters(poly) for poly in polygons]
-        total_area = sum(polygon_areas)
+    def _explode_polygons(self, geoms) -> Tuple[np.ndarray, np.ndarray]:
+        """Explode many geometries into their polygon parts at once.
+        
+        Returns:
+            Tuple of (parts, owners): the Polygon parts in input order, and the
+            index of the geometry each part came from
+        """
+        # Two levels of get_parts flatten a GeometryCollection (result of make_valid
+        # on complex geometries) holding MultiPolygons down to single parts
+        parts, owners = shapely.get_parts(np.asarray(geoms, dtype=object), return_index=True)
+        parts, sub_owners = shapely.get_parts(parts, return_index=True)
+        owners = owners[sub_owners]
+        polygons = shapely.get_type_id(parts) == shapely.GeometryType.POLYGON
+        return parts[polygons], owners[polygons]
+    
+    def _distribute_trees_across_polygons(self, polygons: List[Polygon], total_tree_count: int,
+                                          polygon_areas: Optional[np.ndarray] = None) -> List[int]:
+        """Distribute trees across polygons proportionally by area.
+        
+        polygon_areas (square meters) may be passed in when already computed in bulk.
+        """
+        if polygon_areas is None:
+            polygon_areas = self._calculate_areas_bulk(polygons)
+        total_area = polygon_areas.sum()
         
         if total_area == 0:
             return [0] * len(polygons)
         
-        # Calculate proportional distribution
-        tree_counts = []
-        trees_distributed = 0
+        # Calculate proportional distribution (truncated, as int() did per polygon)
+        tree_counts = (total_tree_count * (polygon_areas / total_area)).astype(np.int64)
         
-        for i, area in enumerate(polygon_areas):
-            if i == len(polygon_areas) - 1:  # Last polygon gets remaining trees
-                tree_count = total_tree_count - trees_distributed
-            else:
-                proportion = area / total_area
-                tree_count = int(total_tree_count * proportion)
-            
-            tree_counts.append(max(0, tree_count))  # Ensure non-negative
-            trees_distributed += tree_count
+        # Last polygon gets remaining trees
+        tree_counts[-1] = total_tree_count - tree_counts[:-1].sum()
         
-        return tree_counts
+        return np.maximum(tree_counts, 0).tolist()  # Ensure non-negative
     
-    def _create_tree_feature(self, point: Point, tree_type: str, source_polygon_id: str) -> Dict:
+    def _create_tree_feature(self, x: float, y: float, tree_type: str, source_polygon_id: str,
+                             tree_id: int) -> Dict:
         """Create a GeoJSON feature for a tree point."""
         return {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
-                "coordinates": [point.x, point.y]
+                "coordinates": [x, y]
             },
             "properties": {
                 "trees": True,
                 "type": tree_type,
                 "source": "generated",
-                "source_polygon_id": source_polygon_id
+                "source_polygon_id": source_polygon_id,
+                "id": tree_id
             }
         }
     
-    def _process_forest_geometry(self, geometry, leaf_type: str, leaf_cycle: str, polygon_id: str) -> List[Dict]:
-        """Process a single forest geometry and generate tree features."""
-        tree_features = []
-        
+    def _process_forest_geometry(self, geometry, leaf_type: str, leaf_cycle: str, polygon_id: str,
+                                 total_tree_count: Optional[int] = None,
+                                 parts: Optional[np.ndarray] = None,
+                                 part_areas: Optional[np.ndarray] = None) -> List[TreeRow]:
+        """Process a single forest geometry and generate its tree rows.
+        
+        total_tree_count, and the geometry's polygon parts with their areas in
+        square meters, may be passed in when they were already computed in bulk.
+        """
         # Since geometry is already clipped in process_forest_features, 
         # we don't need to clip again here. Just calculate area directly.
-        total_area_sq_meters = self._calculate_area_in_sq_meters(geometry)
-        total_tree_count = self.calculate_tree_count(total_area_sq_meters)
+        if total_tree_count is None:
+            total_area_sq_meters = self._calculate_area_in_sq_meters(geometry)
+            total_tree_count = self.calculate_tree_count(total_area_sq_meters)
         
         if total_tree_count == 0:
-            return tree_features
+            return []
         
         # Extract valid polygons
-        valid_polygons = self._extract_valid_polygons(geometry)
+        if parts is None:
+            valid_polygons = self._extract_valid_polygons(geometry)
+        else:
+            valid_polygons = parts.tolist()
         if not valid_polygons:
-            return tree_features
+            return []
         
         # Distribute trees across polygons
-        tree_counts = self._distribute_trees_across_polygons(valid_polygons, total_tree_count)
+        tree_counts = self._distribute_trees_across_polygons(valid_polygons, total_tree_count, part_areas)
         
         # Generate tree type
-        tree_type = self._map_tree_type(leaf_type, leaf_cycle, self.resort_config.get('default_tree_type', 'tree:mixed'))
-        
-        # Generate points for each polygon
-        for polygon, tree_count in zip(valid_polygons, tree_counts):
-            if tree_count > 0:
-                points = self.generate_random_points_in_polygon(polygon, tree_count)
-                for point in points:
-                    tree_feature = self._create_tree_feature(point, tree_type, polygon_id)
-                    tree_features.append(tree_feature)
+        tree_type = self._map_tree_type(leaf_type, leaf_cycle, self._default_tree_type)
+        
+        # Generate points for each polygon, with envelopes and areas taken in bulk
+        all_bounds = shapely.bounds(valid_polygons).tolist()
+        all_areas = shapely.area(valid_polygons).tolist()
+        coords = [
+            self.generate_random_points_in_polygon(polygon, tree_count, tuple(bounds), area)
+            for polygon, tree_count, bounds, area in zip(valid_polygons, tree_counts, all_bounds, all_areas)
+            if tree_count > 0
+        ]
+        if not coords:
+            return []
         
-        return tree_features
+        return [(x, y, tree_type, polygon_id) for x, y in np.concatenate(coords).tolist()]
     
-    def generate_tree_points(self, forest_gdf: gpd.GeoDataFrame) -> List[Dict]:
-        """Generate individual tree points for forest polygons within the feature boundary."""
-        tree_features = []
+    def generate_tree_points(self, forest_gdf: gpd.GeoDataFrame) -> List[TreeRow]:
+        """Generate individual tree points for forest polygons within the feature boundary.
         
-        for idx, row in forest_gdf.iterrows():
-            leaf_type = row.get('leaf_type')
-            leaf_cycle = row.get('leaf_cycle')
-            
-            forest_trees = self._process_forest_geometry(
-                row.geometry, leaf_type, leaf_cycle, str(idx)
+        Trees are returned as plain TreeRow tuples, which are far cheaper than
+        feature dicts to build and to pickle back from chunk workers;
+        prepare_output turns them into features as the output is written.
+        """
+        # Classify every forest into its density tier in one pass, reusing the
+        # areas process_forest_features already attached when present
+        if 'area_sq_meters' in forest_gdf.columns:
+            areas = forest_gdf['area_sq_meters'].to_numpy()
+        else:
+            areas = self._calculate_areas_bulk(forest_gdf.geometry.to_numpy())
+        tree_counts = self.calculate_tree_counts_bulk(areas).tolist()
+        
+        # Explode every forest into its polygon parts and project those in one
+        # batch too, instead of once per forest; parts come out grouped by forest
+        geometries = forest_gdf.geometry.to_numpy()
+        parts, owners = self._explode_polygons(geometries)
+        part_areas = self._calculate_areas_bulk(parts)
+        part_offsets = np.searchsorted(owners, np.arange(len(geometries) + 1)).tolist()
+        
+        rows = zip(
+            forest_gdf.index.tolist(),
+            geometries,
+            self._column_values(forest_gdf, 'leaf_type'),
+            self._column_values(forest_gdf, 'leaf_cycle'),
+            tree_counts,
+            part_offsets[:-1],
+            part_offsets[1:],
+        )
+        return list(itertools.chain.from_iterable(
+            self._process_forest_geometry(
+                geometry, leaf_type, leaf_cycle, str(idx), total_tree_count=tree_count,
+                parts=parts[start:end], part_areas=part_areas[start:end]
             )
-            tree_features.extend(forest_trees)
-        
-        return tree_features
+            for idx, geometry, leaf_type, leaf_cycle, tree_count, start, end in rows
+        ))
     
-    def process_forest_features(self, features_gdf: gpd.GeoDataFrame) -> Tuple[List[Dict], List[Dict]]:
-        """Process forest features and generate tree points."""
-        forest_features = []
-        
+    def process_forest_features(self, features_gdf: gpd.GeoDataFrame) -> Tuple[List[Dict], List[TreeRow]]:
+        """Process forest features and generate tree points (as TreeRow tuples)."""
         # Check if the dataframe is empty
         if features_gdf.empty:
             print("No OSM features found, skipping forest processing")
             return [], []
         
         # Filter for forest features (check if columns exist first)
-        forest_mask = pd.Series([False] * len(features_gdf), index=features_gdf.index)
+        forest_mask = np.zeros(len(features_gdf), dtype=bool)
         
         if 'landuse' in features_gdf.columns:
-            forest_mask |= (features_gdf['landuse'] == 'forest')
+            forest_mask |= features_gdf['landuse'].to_numpy() == 'forest'
         if 'natural' in features_gdf.columns:
-            forest_mask |= (features_gdf['natural'] == 'wood')
+            forest_mask |= features_gdf['natural'].to_numpy() == 'wood'
         
-        forest_gdf = features_gdf[forest_mask].copy()
+        forest_gdf = self._select_rows(features_gdf, forest_mask, ['leaf_type', 'leaf_cycle', '@id'])
         
         if forest_gdf.empty:
             return [], []
         
         # Clip forest features to boundary
-        clipped_forest_gdf = self.clip_to_boundary(forest_gdf)
+        clipped_forest_gdf = self._clip_to_boundary_cached('forest', forest_gdf)
         
         if clipped_forest_gdf.empty:
             return [], []
         
+        # Calculate all forest areas in one batch projection; the column travels
+        # with each chunk so tree generation does not project them again
+        areas = self._calculate_areas_bulk(clipped_forest_gdf.geometry.to_numpy())
+        clipped_forest_gdf = clipped_forest_gdf.assign(area_sq_meters=areas)
+        forest_areas = areas.tolist()
+        
+        # Map leaf_type to standardized tree type for every forest at once
+        tree_types = self._map_tree_types(clipped_forest_gdf, self._default_tree_type)
+        rows = zip(
+            _geometries_to_geojson(clipped_forest_gdf.geometry.to_numpy()),
+            tree_types,
+            forest_areas,
+            self._column_values(clipped_forest_gdf, '@id', ''),
+        )
+        
         # Process forest polygons
-        for idx, row in clipped_forest_gdf.iterrows():
-            # Calculate area
-            geom = row.geometry
-            area_sq_meters = self._calculate_area_in_sq_meters(geom)
-            
-            # Map leaf_type to standardized tree type
-            leaf_type = row.get('leaf_type')
-            leaf_cycle = row.get('leaf_cycle')
-            tree_type = self._map_tree_type(leaf_type, leaf_cycle, self.resort_config.get('default_tree_type', 'tree:mixed'))
-            
-            feature = {
+        forest_features = [
+            {
                 "type": "Feature",
-                "geometry": row.geometry.__geo_interface__,
+                "geometry": geometry,
                 "properties": {
                     "trees": True,
                     "type": tree_type,
                     "area_sq_meters": area_sq_meters,
-                    "@id": row.get('@id', '')
+                    "@id": osm_id
                 }
             }
-            forest_features.append(feature)
+            for geometry, tree_type, area_sq_meters, osm_id in rows
+        ]
         
-        # Generate individual tree points
-        tree_points = self.generate_tree_points(clipped_forest_gdf)
+        # Generate individual tree points; forests are independent, so many of
+        # them are spread over a process pool (without the @id column, which
+        # tree generation does not read)
+        tree_points = self._process_with_memory_management(
+            clipped_forest_gdf.drop(columns='@id', errors='ignore'), self.generate_tree_points,
+            threshold=PARALLEL_FOREST_THRESHOLD, chunk_size=PARALLEL_FOREST_CHUNK_SIZE
+        )
         
         return forest_features, tree_points
     
     def process_rock_features(self, features_gdf: gpd.GeoDataFrame) -> List[Dict]:
         """Process rock features."""
-        rock_features = []
-        
         # Check if the dataframe is empty
         if features_gdf.empty:
             print("No OSM features found, skipping rock processing")
             return []
         
         # Filter for rock features (check if columns exist first)
-        rock_mask = pd.Series([False] * len(features_gdf), index=features_gdf.index)
+        rock_mask = np.zeros(len(features_gdf), dtype=bool)
         
         if 'natural' in features_gdf.columns:
-            rock_mask |= features_gdf['natural'].isin(['rock', 'cliff', 'scree', 'bare_rock', 'stone'])
+            rock_mask |= np.isin(features_gdf['natural'].to_numpy(), self.ROCK_NATURAL_TYPES)
         if 'landuse' in features_gdf.columns:
-            rock_mask |= (features_gdf['landuse'] == 'quarry')
+            rock_mask |= features_gdf['landuse'].to_numpy() == 'quarry'
         
-        rock_gdf = features_gdf[rock_mask].copy()
+        rock_gdf = self._select_rows(features_gdf, rock_mask, ['@id'])
         
         if rock_gdf.empty:
             return []
         
         # Clip rock features to boundary
-        clipped_rock_gdf = self.clip_to_boundary(rock_gdf)
+        clipped_rock_gdf = self._clip_to_boundary_cached('rock', rock_gdf)
         
         if clipped_rock_gdf.empty:
             return []
         
         # Process rock features
-        for idx, row in clipped_rock_gdf.iterrows():
-            feature = {
+        osm_ids = self._column_values(clipped_rock_gdf, '@id', '')
+        return [
+            {
                 "type": "Feature",
-                "geometry": row.geometry.__geo_interface__,
+                "geometry": geometry,
                 "properties": {
                     "type": "rock",
-                    "@id": row.get('@id', '')
+                    "@id": osm_id
                 }
             }
-            rock_features.append(feature)
-        
-        return rock_features
+            for geometry, osm_id in zip(_geometries_to_geojson(clipped_rock_gdf.geometry.to_numpy()), osm_ids)
+        ]
     
     def _map_zone_type(self, zone_type: str) -> str:
         """Map ZoneType to standardized type."""
-        zone_mapping = {
-            'slow_zone': 'zone:slow',
-            'closed_area': 'zone:closed',
-            'ski_area_boundary': 'boundary:ski',
-            'feature_boundary': 'boundary:feature',  # Boundary for tree/rock generation
-            'beginner_area': 'zone:beginner',  # Not in spec but handling it
-            # Add support for first-tracks if it appears in data
-            'first_tracks': 'boundary:first-tracks'
+        return self.ZONE_TYPE_MAP.get(zone_type, zone_type)
+    
+    def _map_zone_types(self, boundaries_gdf: gpd.GeoDataFrame) -> List[str]:
+        """Vectorized _map_zone_type over a frame's ZoneType column."""
+        if 'ZoneType' not in boundaries_gdf.columns:
+            return [''] * len(boundaries_gdf)
+        zone_types = boundaries_gdf['ZoneType'].astype(object).fillna('')
+        return zone_types.map(self.ZONE_TYPE_MAP).fillna(zone_types).tolist()
+    
+    def _boundary_properties(self, zone_type: str, standardized_type: str) -> Dict[str, Any]:
+        """Output properties shared by every boundary feature of one zone type."""
+        # Set styling based on zone type
+        properties = {
+            "type": standardized_type
         }
-        return zone_mapping.get(zone_type, zone_type)
+        
+        # Add appropriate top-level property based on type
+        if standardized_type.startswith('boundary:'):
+            properties["boundaries"] = True
+        elif standardized_type.startswith('zone:'):
+            properties["zones"] = True
+        
+        properties.update(self.ZONE_STYLE_PROPERTIES.get(zone_type, {}))
+        return properties
     
     def process_boundary_features(self, boundaries_gdf: gpd.GeoDataFrame) -> List[Dict]:
         """Process boundary features for styling."""
         boundary_features = []
-        zone_styles = DEFAULT_ZONE_STYLES
         
-        for idx, row in boundaries_gdf.iterrows():
-            zone_type = row.get('ZoneType', '')
-            standardized_type = self._map_zone_type(zone_type)
-            
-            # Set styling based on zone type
-            properties = {
-                "type": standardized_type
-            }
-            
-            # Add appropriate top-level property based on type
-            if standardized_type.startswith('boundary:'):
-                properties["boundaries"] = True
-            elif standardized_type.startswith('zone:'):
-                properties["zones"] = True
-            
-            if zone_type in zone_styles:
-                style = zone_styles[zone_type]
-                properties.update({
-                    "stroke": style.get('stroke_color', '#000000'),
-                    "stroke-opacity": style.get('stroke_opacity', 1.0)
-                })
-                
-                # Add fill properties if they exist
-                if 'fill_color' in style:
-                    properties["fill"] = style['fill_color']
-                if 'fill_opacity' in style:
-                    properties["fill-opacity"] = style['fill_opacity']
-                if 'stroke_width' in style:
-                    properties["stroke-width"] = style['stroke_width']
+        # Boundaries come in a handful of zone types; build each type's
+        # properties once and give every feature its own copy
+        templates: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        zone_types = self._column_values(boundaries_gdf, 'ZoneType', '')
+        standardized_types = self._map_zone_types(boundaries_gdf)
+        rows = zip(_geometries_to_geojson(boundaries_gdf.geometry.to_numpy()), zone_types, standardized_types)
+        for geometry, zone_type, standardized_type in rows:
+            template = templates.get((zone_type, standardized_type))
+            if template is None:
+                template = templates[(zone_type, standardized_type)] = \
+                    self._boundary_properties(zone_type, standardized_type)
             
             feature = {
                 "type": "Feature",
-                "geometry": row.geometry.__geo_interface__,
-                "properties": properties
+                "geometry": geometry,
+                "properties": dict(template)
             }
             boundary_features.append(feature)
         
         return boundary_features
     
-    def create_output_geojson(self) -> Dict:
-        """Create the final merged GeoJSON output."""
-        # Set random seed for reproducibility
-        random.seed(self.resort_config['tree_config']['random_seed'])
+    def prepare_output(self, timestamp: Optional[str] = None) -> Tuple[Dict, Iterator[Dict]]:
+        """Process all features and return the output metadata and a feature iterator.
+        
+        Features are yielded in output order (boundaries, forests, trees, rocks)
+        without being concatenated into one list, so callers can stream them.
+        
+        Args:
+            timestamp: Metadata timestamp (TIMESTAMP_FORMAT); batch runs pass one
+                shared value. Defaults to the current local time.
+        """
+        # Seed a per-processor generator so concurrent processors stay reproducible
+        self.rng = np.random.default_rng(self._random_seed)
         
         boundaries_gdf, features_gdf = self.load_data()
         
@@ -1001,35 +1429,53 @@ class ResortProcessor:
         osm_tree_points = self.process_osm_tree_nodes(features_gdf)
         rock_features = self.process_rock_features(features_gdf)
         
-        # Combine all features (OSM trees + generated trees)
-        all_tree_points = osm_tree_points + generated_tree_points
-        
-        # Add incrementing integer IDs to all tree points
-        for tree_id, tree_feature in enumerate(all_tree_points, start=1):
-            tree_feature['properties']['id'] = tree_id
+        # All tree points (OSM trees + generated trees), chained rather than copied into one list
+        tree_points_total = len(osm_tree_points) + len(generated_tree_points)
+        
+        # Add incrementing integer IDs to all tree points: OSM trees first (set
+        # last, so "id" stays the final property), then generated trees, whose
+        # features are only built as the output iterator is consumed
+        tree_ids = itertools.count(1)
+        for properties, tree_id in zip(map(itemgetter('properties'), osm_tree_points), tree_ids):
+            properties['id'] = tree_id
+        generated_tree_features = (
+            self._create_tree_feature(x, y, tree_type, polygon_id, tree_id)
+            for (x, y, tree_type, polygon_id), tree_id in zip(generated_tree_points, tree_ids)
+        )
+        
+        total_features = len(boundary_features) + len(forest_features) + tree_points_total + len(rock_features)
+        
+        metadata = {
+            "generator": "geojson-processor-standalone",
+            "resort_name": self.resort_name,
+            "timestamp": timestamp or time.strftime(TIMESTAMP_FORMAT),
+            "total_features": total_features,
+            "boundary_features": len(boundary_features),
+            "forest_features": len(forest_features),
+            "tree_points_total": tree_points_total,
+            "tree_points_osm": len(osm_tree_points),
+            "tree_points_generated": len(generated_tree_points),
+            "tree_id_range": {"min": 1, "max": tree_points_total} if tree_points_total else {"min": 0, "max": 0},
+            "rock_features": len(rock_features),
+            "tree_config": self.resort_config['tree_config'],
+            "center": self.resort_config.get('center'),
+            "zoom": self.resort_config.get('zoom', 14),
+            "bounds": self.resort_config.get('bounds')
+        }
         
-        all_features = boundary_features + forest_features + all_tree_points + rock_features
+        features = itertools.chain(
+            boundary_features, forest_features, osm_tree_points, generated_tree_features, rock_features
+        )
+        return metadata, features
+    
+    def create_output_geojson(self, timestamp: Optional[str] = None) -> Dict:
+        """Create the final merged GeoJSON output."""
+        metadata, features = self.prepare_output(timestamp)
         
         output_geojson = {
             "type": "FeatureCollection",
-            "features": all_features,
-            "metadata": {
-                "generator": "geojson-processor-standalone",
-                "resort_name": self.resort_name,
-                "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT),
-                "total_features": len(all_features),
-                "boundary_features": len(boundary_features),
-                "forest_features": len(forest_features),
-                "tree_points_total": len(all_tree_points),
-                "tree_points_osm": len(osm_tree_points),
-                "tree_points_generated": len(generated_tree_points),
-                "tree_id_range": {"min": 1, "max": len(all_tree_points)} if all_tree_points else {"min": 0, "max": 0},
-                "rock_features": len(rock_features),
-                "tree_config": self.resort_config['tree_config'],
-                "center": self.resort_config.get('center'),
-                "zoom": self.resort_config.get('zoom', 14),
-                "bounds": self.resort_config.get('bounds')
-            }
+            "features": list(features),
+            "metadata": metadata
         }
         
-        return output_geojson
\ No newline at end of file
+        return output_geojson
@@ -0,0 +1,61 @@
+"""
+Uniform point sampling over a polygon's constrained triangulation
+"""
+
+from typing import Optional
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+# shapely.constrained_delaunay_triangles needs Shapely 2.1 (GEOS 3.10); without
+# it callers fall back to rejection sampling
+HAS_CONSTRAINED_TRIANGULATION = hasattr(shapely, 'constrained_delaunay_triangles')
+
+
+def polygon_triangles(polygon: Polygon) -> Optional[np.ndarray]:
+    """
+    Triangulate a polygon, holes included, exactly along its edges.
+
+    Returns:
+        (T, 3, 2) float array of triangle vertices, or None if the polygon
+        cannot be triangulated
+    """
+    if not HAS_CONSTRAINED_TRIANGULATION or polygon.is_empty or not polygon.is_valid:
+        return None
+
+    triangles = shapely.get_parts(shapely.constrained_delaunay_triangles(polygon))
+    if len(triangles) == 0:
+        return None
+
+    # Each triangle is a closed 4-vertex ring; drop the repeated closing vertex
+    coords = shapely.get_coordinates(shapely.get_exterior_ring(triangles))
+    return coords.reshape(len(triangles), 4, 2)[:, :3]
+
+
+def sample_triangles(triangles: np.ndarray, num_points: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw points uniformly over a set of triangles.
+
+    Picks a triangle per point with probability proportional to its area
+    (inverse CDF over cumulative areas), then a uniform barycentric position
+    inside it, folding (r1, r2) back into the triangle when r1 + r2 > 1.
+
+    Returns:
+        (num_points, 2) float array of x, y coordinates
+    """
+    a = triangles[:, 0]
+    ab = triangles[:, 1] - a
+    ac = triangles[:, 2] - a
+    areas = np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+
+    cumulative = np.cumsum(areas)
+    picks = np.searchsorted(cumulative, rng.uniform(0, cumulative[-1], num_points), side='right')
+    picks = np.minimum(picks, len(triangles) - 1)
+
+    r1, r2 = rng.random((2, num_points))
+    outside = r1 + r2 > 1
+    r1[outside] = 1 - r1[outside]
+    r2[outside] = 1 - r2[outside]
+
+    return a[picks] + r1[:, None] * ab[picks] + r2[:, None] * ac[picks]
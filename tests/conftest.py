@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the src package importable as in scripts/
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,29 @@
+"""
+Tests for the cached YAML configuration loader
+"""
+
+import datetime
+import json
+
+from src.config_cache import CACHE_SUFFIX, load_config_cached
+
+
+def test_sidecar_is_json_and_reused(tmp_path):
+    config_file = tmp_path / 'resorts.yaml'
+    config_file.write_text("stratton:\n  tree_config:\n    random_seed: 42\n")
+
+    config = load_config_cached(str(config_file))
+
+    sidecar = json.loads((tmp_path / ('resorts.yaml' + CACHE_SUFFIX)).read_text())
+    assert sidecar['config'] == config == {'stratton': {'tree_config': {'random_seed': 42}}}
+    assert load_config_cached(str(config_file)) == config
+
+
+def test_config_that_does_not_round_trip_is_not_cached(tmp_path):
+    config_file = tmp_path / 'resorts.yaml'
+    config_file.write_text("stratton:\n  updated: 2024-01-01\n")
+
+    config = load_config_cached(str(config_file))
+
+    assert config == {'stratton': {'updated': datetime.date(2024, 1, 1)}}
+    assert not (tmp_path / ('resorts.yaml' + CACHE_SUFFIX)).exists()
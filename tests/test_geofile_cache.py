@@ -0,0 +1,84 @@
+"""
+Tests for the GeoPackage geofile and layer caches
+"""
+
+import pytest
+
+gpd = pytest.importorskip('geopandas')
+import pyogrio
+from shapely.geometry import Point
+
+from src import geofile_cache
+from src.geofile_cache import read_cached_layer, read_geofile_cached, write_cached_layer
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A small GeoJSON source file with a filterable attribute."""
+    path = tmp_path / 'osm_features.geojson'
+    gdf = gpd.GeoDataFrame(
+        {'natural': ['tree', 'rock', 'tree'], 'name': ['a', 'b', 'c']},
+        geometry=[Point(0, 0), Point(1, 1), Point(2, 2)],
+        crs='EPSG:4326',
+    )
+    pyogrio.write_dataframe(gdf, path, driver='GeoJSON')
+    return path
+
+
+@pytest.fixture
+def read_paths(monkeypatch):
+    """Record the path of every pyogrio.read_dataframe call made by the cache."""
+    paths = []
+    read_dataframe = pyogrio.read_dataframe
+
+    def recording_read(path, *args, **kwargs):
+        paths.append(str(path))
+        return read_dataframe(path, *args, **kwargs)
+
+    monkeypatch.setattr(geofile_cache.pyogrio, 'read_dataframe', recording_read)
+    return paths
+
+
+def test_sidecar_written_on_first_load_and_read_on_second(source, read_paths):
+    first = read_geofile_cached(source)
+
+    sidecars = list(source.parent.glob(f"{source.name}.*.gpkg"))
+    assert len(sidecars) == 1
+    assert not list(source.parent.glob('.gpkg-*'))
+
+    read_paths.clear()
+    second = read_geofile_cached(source)
+
+    assert read_paths == [str(sidecars[0])]
+    assert len(second) == len(first) == 3
+
+
+def test_filtered_reads_come_from_sidecar(source, read_paths):
+    first = read_geofile_cached(source, columns=['natural'], where="natural = 'tree'")
+
+    assert [path.endswith('.gpkg') for path in read_paths] == [False, True]
+    assert list(first['natural']) == ['tree', 'tree']
+    assert 'name' not in first.columns
+
+    read_paths.clear()
+    second = read_geofile_cached(source, columns=['natural'], where="natural = 'tree'")
+
+    assert len(read_paths) == 1 and read_paths[0].endswith('.gpkg')
+    assert list(second['natural']) == ['tree', 'tree']
+
+
+def test_cached_layer_round_trip(tmp_path):
+    gdf = gpd.GeoDataFrame(
+        {'leaf_type': ['needleleaved', 'broadleaved']},
+        geometry=[Point(0, 0).buffer(1), Point(5, 5).buffer(1)],
+        index=[7, 42],
+        crs='EPSG:4326',
+    )
+    cache_file = tmp_path / 'clip' / 'layer.gpkg'
+
+    write_cached_layer(cache_file, gdf)
+    cached = read_cached_layer(cache_file)
+
+    assert cache_file.exists()
+    assert list(cached.index) == [7, 42]
+    assert list(cached['leaf_type']) == ['needleleaved', 'broadleaved']
@@ -0,0 +1,44 @@
+"""
+Tests for processed output serialization
+"""
+
+import json
+
+import pytest
+
+from src.output import metadata_path, write_geojsonseq
+
+FEATURES = [
+    {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [-72.9, 43.1]},
+        "properties": {"trees": True, "type": "tree:needle", "id": 1},
+    },
+    {
+        "type": "Feature",
+        "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        "properties": {"type": "zone:slow", "zones": True},
+    },
+]
+METADATA = {"resort_name": "test", "total_features": 2}
+
+
+def test_geojsonseq_lines_are_features(tmp_path):
+    output_file = tmp_path / 'test_processed.geojsonl'
+
+    write_geojsonseq(METADATA, iter(FEATURES), output_file)
+
+    lines = output_file.read_text().splitlines()
+    assert [json.loads(line)['type'] for line in lines] == ['Feature', 'Feature']
+    assert json.loads(metadata_path(output_file).read_text()) == METADATA
+
+
+def test_geojsonseq_readable_by_gdal(tmp_path):
+    pyogrio = pytest.importorskip('pyogrio')
+    output_file = tmp_path / 'test_processed.geojsonl'
+
+    write_geojsonseq(METADATA, iter(FEATURES), output_file)
+    gdf = pyogrio.read_dataframe(output_file, driver='GeoJSONSeq')
+
+    assert len(gdf) == len(FEATURES)
+    assert list(gdf['type']) == ['tree:needle', 'zone:slow']
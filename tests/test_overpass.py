@@ -0,0 +1,36 @@
+"""
+Tests for the Overpass client's circuit breaker
+"""
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('requests')
+
+from src import overpass
+from src.overpass import OverpassClient, _Breaker
+
+
+class _FailingSession:
+    """Session whose POST fails with an error that is not a requests exception."""
+
+    def post(self, *args, **kwargs):
+        raise RuntimeError("parser exploded")
+
+
+def test_half_open_trial_failing_with_non_http_error_reopens_breaker(tmp_path, monkeypatch):
+    breaker = _Breaker(failure_threshold=1, reset_timeout=0)
+    breaker.on_failure()  # open; with no cooldown the next call is the half-open trial
+    monkeypatch.setattr(overpass, '_breaker', breaker)
+    monkeypatch.setattr(OverpassClient, 'CACHE_DIR', tmp_path)
+
+    client = OverpassClient()
+    client.session = _FailingSession()
+
+    with pytest.raises(RuntimeError):
+        client._post('[out:json];node(1);out;')
+
+    # The failed trial reopened the circuit instead of leaving it stuck half-open
+    assert breaker.state == 'open'
+    breaker.before_call()
+    assert breaker.state == 'half_open'
@@ -0,0 +1,64 @@
+"""
+Tests for ResortProcessor feature processing
+"""
+
+import pytest
+
+gpd = pytest.importorskip('geopandas')
+import pandas as pd
+from shapely.geometry import box
+
+from src.processor import ResortProcessor
+
+
+def _processor() -> ResortProcessor:
+    return ResortProcessor('test', config_dict={'test': {}}, workers=1)
+
+
+def test_boundary_features_with_categorical_zone_type():
+    """load_data stores ZoneType as a categorical; missing values must not break styling."""
+    boundaries_gdf = gpd.GeoDataFrame(
+        {'ZoneType': pd.Categorical(['slow_zone', None, 'ski_area_boundary'])},
+        geometry=[box(0, 0, 1, 1), box(1, 1, 2, 2), box(2, 2, 3, 3)],
+        crs='EPSG:4326',
+    )
+
+    features = _processor().process_boundary_features(boundaries_gdf)
+
+    assert [feature['properties']['type'] for feature in features] == ['zone:slow', '', 'boundary:ski']
+    assert features[0]['properties']['zones'] is True
+    assert features[0]['properties']['stroke'] == '#FFFF00'
+    assert features[1]['properties'] == {'type': ''}
+    assert features[2]['properties']['boundaries'] is True
+
+
+def test_clip_cache_round_trip(tmp_path, monkeypatch):
+    """With GEOWELD_CACHE=1 a second run reuses the clipped layer without clipping."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GEOWELD_CACHE', '1')
+    for name in ('boundaries.geojson', 'osm_features.geojson'):
+        (tmp_path / name).write_text('{"type": "FeatureCollection", "features": []}')
+    config = {'test': {'data_files': {'boundaries': 'boundaries.geojson',
+                                      'osm_features': 'osm_features.geojson'}}}
+    forest_gdf = gpd.GeoDataFrame(
+        {'leaf_type': ['needleleaved', 'broadleaved', 'mixed']},
+        geometry=[box(0, 0, 1, 1), box(1.5, 1.5, 3, 3), box(5, 5, 6, 6)],
+        crs='EPSG:4326',
+    )
+
+    def run() -> ResortProcessor:
+        processor = ResortProcessor('test', config_dict=config, workers=1)
+        processor.feature_boundary = box(0, 0, 2, 2)
+        return processor
+
+    first = run()._clip_to_boundary_cached('forest', forest_gdf)
+    assert list((tmp_path / '.cache' / 'clip').glob('*.gpkg'))
+
+    second_run = run()
+    monkeypatch.setattr(second_run, 'clip_to_boundary',
+                        lambda gdf: pytest.fail("clip_to_boundary ran despite a cached layer"))
+    second = second_run._clip_to_boundary_cached('forest', forest_gdf)
+
+    assert list(second.index) == list(first.index)
+    assert list(second['leaf_type']) == list(first['leaf_type']) == ['needleleaved', 'broadleaved']
+    assert second.geometry.equals_exact(first.geometry, tolerance=1e-12).all()
@@ -194,6 +194,10 @@ const fetchMapboxToken = async () => {
 };
 
 const loadConstants = async () => {
+  // Prefer the build-time generated constants; fall back to the API in dev
+  if (typeof GEOWELD_CONSTANTS !== "undefined") {
+    return GEOWELD_CONSTANTS;
+  }
   try {
     const res = await fetch(`${API_URL}/api/constants`);
     const data = await res.json();